@@ -391,11 +391,15 @@ class OfficeVBACLI:
 
     def handle_office_vba_command(self, args: argparse.Namespace) -> None:
         """Handle the office-vba command execution."""
+        # Read once; used for logging setup, the handler and both error paths
+        verbose = getattr(args, "verbose", False)
         try:
             # Initialize logging
-            setup_logging(verbose=getattr(args, "verbose", False), logfile=getattr(args, "logfile", None))
-            self.logger.debug(f"Starting {self.office_app}-vba command: {args.command}")
-            self.logger.debug(f"Command arguments: {vars(args)}")
+            setup_logging(verbose=verbose, logfile=getattr(args, "logfile", None))
+            self.logger.debug("Starting %s-vba command: %s", self.office_app, args.command)
+            # Formatting the full namespace is only worth it when debug output is emitted
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Command arguments: %s", vars(args))
 
             # Ensure paths exist early (creates vba_directory if provided)
             self.validate_paths(args)
@@ -426,15 +430,15 @@ class OfficeVBACLI:
                     get_placeholders_for_config_key(CONFIG_KEY_VBA_DIRECTORY),
                 )
                 file_type = self.config["file_type"]
-                self.logger.info(f"Using {file_type}: {file_path}")
-                self.logger.debug(f"Using VBA directory: {vba_dir}")
+                self.logger.info("Using %s: %s", file_type, file_path)
+                self.logger.debug("Using VBA directory: %s", vba_dir)
             except (DocumentNotFoundError, PathError) as e:
-                self.logger.error(f"Failed to resolve paths: {str(e)}")
+                self.logger.error("Failed to resolve paths: %s", e)
                 sys.exit(1)
 
             # Determine encoding
             encoding = None if getattr(args, "detect_encoding", False) else args.encoding
-            self.logger.debug(f"Using encoding: {encoding or 'auto-detect'}")
+            self.logger.debug("Using encoding: %s", encoding or "auto-detect")
 
             # Validate header options
             validate_header_options(args)
@@ -446,7 +450,7 @@ class OfficeVBACLI:
                     doc_path=str(file_path),
                     vba_dir=str(vba_dir),
                     encoding=encoding,
-                    verbose=getattr(args, "verbose", False),
+                    verbose=verbose,
                     save_headers=getattr(args, "save_headers", False),
                     use_rubberduck_folders=getattr(args, "rubberduck_folders", False),
                     open_folder=getattr(args, "open_folder", False),
@@ -454,11 +458,11 @@ class OfficeVBACLI:
                 )
             except VBAError as e:
                 app_name = self.config["app_name"]
-                self.logger.error(f"Failed to initialize {app_name} VBA handler: {str(e)}")
+                self.logger.error("Failed to initialize %s VBA handler: %s", app_name, e)
                 sys.exit(1)
 
             # Execute requested command
-            self.logger.info(f"Executing command: {args.command}")
+            self.logger.info("Executing command: %s", args.command)
             try:
                 if args.command == "edit":
                     print("NOTE: Deleting a VBA module file will also delete it in the VBA editor!")
@@ -483,7 +487,7 @@ class OfficeVBACLI:
                         self.logger.error(str(e))
                         app_name = self.config["app_name"]
                         self.logger.info(
-                            f"Edit session terminated. Please restart {app_name} and this tool to continue editing."
+                            "Edit session terminated. Please restart %s and this tool to continue editing.", app_name
                         )
                         sys.exit(1)
                 elif args.command == "import":
@@ -503,14 +507,14 @@ class OfficeVBACLI:
             except VBAAccessError as e:
                 self.logger.error(str(e))
                 app_name = self.config["app_name"]
-                self.logger.error(f"Please check {app_name} Trust Center Settings and try again.")
+                self.logger.error("Please check %s Trust Center Settings and try again.", app_name)
                 sys.exit(1)
             except VBAError as e:
-                self.logger.error(f"VBA operation failed: {str(e)}")
+                self.logger.error("VBA operation failed: %s", e)
                 sys.exit(1)
             except Exception as e:
-                self.logger.error(f"Unexpected error: {str(e)}")
-                if getattr(args, "verbose", False):
+                self.logger.error("Unexpected error: %s", e)
+                if verbose:
                     self.logger.exception("Detailed error information:")
                 sys.exit(1)
 
@@ -518,8 +522,8 @@ class OfficeVBACLI:
             self.logger.info("\nOperation interrupted by user")
             sys.exit(0)
         except Exception as e:
-            self.logger.error(f"Critical error: {str(e)}")
-            if getattr(args, "verbose", False):
+            self.logger.error("Critical error: %s", e)
+            if verbose:
                 self.logger.exception("Detailed error information:")
             sys.exit(1)
         finally:
@@ -528,16 +532,19 @@ class OfficeVBACLI:
     def main(self) -> None:
         """Main entry point for the Office VBA CLI."""
         try:
+            # Scan raw argv once for flags that must be handled before argparse runs
+            argv_set = frozenset(sys.argv)
+
             # Check for --no-color flag BEFORE creating parser
             # This ensures help messages honor the flag
-            if "--no-color" in sys.argv or "--no-colour" in sys.argv:
+            if not argv_set.isdisjoint(("--no-color", "--no-colour")):
                 from vba_edit.console import disable_colors
 
                 disable_colors()
 
             # Handle easter egg flags first (before argparse validation)
             # This allows them to work without requiring a command
-            if "--diagram" in sys.argv or "--how-it-works" in sys.argv:
+            if not argv_set.isdisjoint(("--diagram", "--how-it-works")):
                 from vba_edit.utils import show_workflow_diagram
 
                 show_workflow_diagram()
@@ -596,7 +603,7 @@ class OfficeVBACLI:
                     else:
                         check_vba_trust_access(self.office_app)  # Check specific Office app only
                 except Exception as e:
-                    self.logger.error(f"Failed to check Trust Access to VBA project object model: {str(e)}")
+                    self.logger.error("Failed to check Trust Access to VBA project object model: %s", e)
                 sys.exit(0)
             else:
                 self.handle_office_vba_command(args)
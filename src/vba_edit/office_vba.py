@@ -1,4 +1,6 @@
 import datetime
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -93,6 +95,64 @@ def _filter_attributes(code: str) -> str:
     return "\n".join(filtered_lines)
 
 
+# Any content that can contain a header has at least one of these substrings somewhere;
+# content without them (e.g. plain code or headerless .bas files) skips the line scan.
+_HEADER_MARKERS_RE = re.compile(r"VERSION|Attribute VB_|(?i:BEGIN)")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_vba_content(content: str) -> Tuple[str, str]:
+    """Split VBA content into header and code sections (memoized).
+
+    The same file content is typically split several times per import (module type
+    detection, header read, code read) and again whenever an editor re-saves an
+    unchanged file during watch mode. Both results are immutable strings, so
+    caching on the content itself is safe.
+
+    See VBAComponentHandler.split_vba_content for details.
+    """
+    if not content.strip():
+        return "", ""
+
+    # Fast path: no header marker anywhere means there is nothing to split off
+    if not _HEADER_MARKERS_RE.search(content):
+        return "", content
+
+    lines = content.splitlines()
+    last_header_idx = -1
+    in_begin_block = False
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+
+        # Check for header components
+        if stripped.startswith("VERSION"):
+            last_header_idx = i
+        elif stripped.upper() == "BEGIN" or stripped.upper().startswith("BEGIN "):
+            # Matches both "BEGIN" (class modules) and "Begin {GUID} UserFormName" (UserForms)
+            in_begin_block = True
+            last_header_idx = i
+        elif stripped.upper() == "END" and in_begin_block:
+            in_begin_block = False
+            last_header_idx = i
+        elif in_begin_block:
+            # Lines inside BEGIN/END block (like MultiUse or form properties)
+            last_header_idx = i
+        elif stripped.startswith("Attribute VB_"):
+            last_header_idx = i
+        elif last_header_idx >= 0 and not stripped.startswith("Attribute VB_"):
+            # First non-header line after we've seen headers
+            break
+
+    if last_header_idx == -1:
+        return "", content
+
+    header = "\n".join(lines[: last_header_idx + 1])
+    code = "\n".join(lines[last_header_idx + 1 :])
+
+    return header.strip(), code.strip()
+
+
 """
 The VBA import/export/edit functionality is based on the excellent work done by the xlwings project
 (https://github.com/xlwings/xlwings) which is distributed under the BSD 3-Clause License:
@@ -457,42 +517,7 @@ class VBAComponentHandler:
             VB_PredeclaredId, VB_Exposed) are considered part of the header.
             Procedure-level attributes are considered part of the code.
         """
-        if not content.strip():
-            return "", ""
-
-        lines = content.splitlines()
-        last_header_idx = -1
-        in_begin_block = False
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Check for header components
-            if stripped.startswith("VERSION"):
-                last_header_idx = i
-            elif stripped.upper() == "BEGIN" or stripped.upper().startswith("BEGIN "):
-                # Matches both "BEGIN" (class modules) and "Begin {GUID} UserFormName" (UserForms)
-                in_begin_block = True
-                last_header_idx = i
-            elif stripped.upper() == "END" and in_begin_block:
-                in_begin_block = False
-                last_header_idx = i
-            elif in_begin_block:
-                # Lines inside BEGIN/END block (like MultiUse or form properties)
-                last_header_idx = i
-            elif stripped.startswith("Attribute VB_"):
-                last_header_idx = i
-            elif last_header_idx >= 0 and not stripped.startswith("Attribute VB_"):
-                # First non-header line after we've seen headers
-                break
-
-        if last_header_idx == -1:
-            return "", content
-
-        header = "\n".join(lines[: last_header_idx + 1])
-        code = "\n".join(lines[last_header_idx + 1 :])
-
-        return header.strip(), code.strip()
+        return _split_vba_content(content)
 
     def has_inline_headers(self, file_path: Path, encoding: str = "utf-8") -> bool:
         """Detect if a code file contains embedded VBA headers.
@@ -857,6 +882,8 @@ class OfficeVBAHandler(ABC):
             self.app = None
             self.doc = None
             self.component_handler = VBAComponentHandler(use_rubberduck_folders)
+            # Content digests of files last imported in watch mode (see _should_import)
+            self._imported_digests: Dict[Path, bytes] = {}
 
             # Configure logging
             log_level = logging.DEBUG if verbose else logging.INFO
@@ -1122,13 +1149,27 @@ class OfficeVBAHandler(ABC):
                         should_close_app = False
 
                 logger.debug(f"Closing {self.document_type}: {self.doc_path}")
-                # Close without saving (SaveChanges=False / wdDoNotSaveChanges=0)
-                if self.app_name == "Access":
-                    # Access handles close differently
-                    self.app.CloseCurrentDatabase()
-                else:
-                    # Excel, Word, PowerPoint use Close method
-                    self.doc.Close(SaveChanges=False)
+                app_closed = False
+                if self.app_name == "Word" and should_close_app and self.app is not None:
+                    # Word's Quit closes the remaining document as well, so a single
+                    # cross-process call replaces the separate Close + Quit round-trips.
+                    # If Quit fails, fall back to closing the document explicitly.
+                    try:
+                        logger.debug(f"No other documents open, closing {self.app_name} application")
+                        self.app.Quit(SaveChanges=0)  # wdDoNotSaveChanges
+                        self.app = None
+                        app_closed = True
+                    except Exception as e:
+                        logger.debug(f"Quitting {self.app_name} failed, closing document first: {str(e)}")
+
+                if not app_closed:
+                    # Close without saving (SaveChanges=False / wdDoNotSaveChanges=0)
+                    if self.app_name == "Access":
+                        # Access handles close differently
+                        self.app.CloseCurrentDatabase()
+                    else:
+                        # Excel, Word, PowerPoint use Close method
+                        self.doc.Close(SaveChanges=False)
                 self.doc = None
                 logger.info(f"{self.document_type.capitalize()} closed successfully")
 
@@ -1138,13 +1179,16 @@ class OfficeVBAHandler(ABC):
                         logger.debug(f"No other documents open, closing {self.app_name} application")
                         self.app.Quit()
                         self.app = None
-                        logger.info(f"{self.app_name} application closed successfully")
+                        app_closed = True
                     except Exception as e:
                         logger.warning(f"Failed to close {self.app_name} application: {str(e)}")
                         # Don't raise - closing app is not critical
                 elif not should_close_app:
                     logger.debug(f"Other documents are open, keeping {self.app_name} application running")
 
+                if app_closed:
+                    logger.info(f"{self.app_name} application closed successfully")
+
             except Exception as e:
                 logger.warning(f"Failed to close {self.document_type}: {str(e)}")
                 # Don't raise exception - closing is not critical
@@ -1812,8 +1856,49 @@ class OfficeVBAHandler(ABC):
                 f.write(code + "\n")
             logger.debug(f"Saved code file: {code_file}")
 
+    def _should_import(self, path: Path) -> bool:
+        """Check whether a changed file differs from the version last imported in watch mode.
+
+        Editors frequently touch files without changing them (Save All, autoformat).
+        Comparing a content digest against the last imported version skips the full
+        re-import and document save for these events. The new digest is recorded
+        when the file is to be imported.
+
+        Note that re-saving an unchanged file therefore no longer pushes it back over
+        edits made directly in the VBA editor; the file has to actually change.
+
+        Args:
+            path: Path to the added or modified VBA file
+
+        Returns:
+            True if the file should be imported, False if its content is unchanged
+        """
+        try:
+            digest = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+        except OSError:
+            # Can't tell - let the import itself report the problem
+            self._forget_import(path)
+            return True
+
+        if self._imported_digests.get(path) == digest:
+            return False
+        self._imported_digests[path] = digest
+        return True
+
+    def _forget_import(self, path: Path) -> None:
+        """Drop the recorded digest of a file so its next change is always imported.
+
+        Args:
+            path: Path to the deleted or failed VBA file
+        """
+        self._imported_digests.pop(path, None)
+
     def watch_changes(self) -> None:
-        """Watch for changes in VBA files and update the document."""
+        """Watch for changes in VBA files and update the document.
+
+        Files whose content is identical to the version last imported during this
+        session are not re-imported (see _should_import).
+        """
         try:
             logger.info(f"Watching for changes in {self.vba_dir}...")
             last_check_time = time.time()
@@ -1832,6 +1917,8 @@ class OfficeVBAHandler(ABC):
             # Define VBA file extensions we want to watch
             vba_extensions = {".bas", ".cls", ".frm"}
 
+            self._imported_digests.clear()
+
             # Use yield_on_timeout=True so watch yields even without file changes
             # This allows us to check document state periodically
             for changes in watch(
@@ -1872,6 +1959,7 @@ class OfficeVBAHandler(ABC):
 
                                 vba_project = self.get_vba_project()
                                 components = vba_project.VBComponents
+                                self._forget_import(path)
                                 try:
                                     component = components(path.stem)
                                     components.Remove(component)
@@ -1883,8 +1971,16 @@ class OfficeVBAHandler(ABC):
                             elif change_type in (Change.added, Change.modified):
                                 # Handle both added and modified files the same way
                                 action = "addition" if change_type == Change.added else "modification"
+                                if not self._should_import(path):
+                                    logger.debug(f"Skipping {action} in {path}: content unchanged")
+                                    continue
                                 logger.debug(f"Processing {action} in {path}")
-                                self.import_single_file(path)
+                                try:
+                                    self.import_single_file(path)
+                                except Exception:
+                                    # Forget the digest so the next event for this file retries
+                                    self._forget_import(path)
+                                    raise
 
                         except (DocumentClosedError, RPCError) as e:
                             raise e
@@ -2,3 +2,7 @@
 
 # This file can be simplified since the main configuration
 # is now in the parent conftest.py file
+
+# Session-scoped fixtures must be visible to every CLI test module, not only to the
+# modules that import temp_office_doc directly
+from tests.cli.helpers import office_doc_templates
@@ -1,11 +1,18 @@
 """Test helpers for CLI interface testing."""
 
 import atexit
+import gc
+import logging
 import os
+import re
+import shutil
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import pytest
 import pythoncom
@@ -14,10 +21,78 @@ import win32com.client
 from vba_edit.exceptions import VBAError
 from vba_edit.office_vba import OFFICE_MACRO_EXTENSIONS, SUPPORTED_APPS
 
+logger = logging.getLogger(__name__)
+
 # Global application instances
 _app_instances = {}
 _initialized = False
 
+# Apps probed by check_office_apps_are_safe_to_use: (label, ProgID, document collection)
+_SAFETY_PROBES = (
+    ("Excel", "Excel.Application", "Workbooks"),
+    ("Word", "Word.Application", "Documents"),
+    ("PowerPoint", "PowerPoint.Application", "Presentations"),
+)
+
+# Cached verdict of check_excel_is_safe_to_use
+_excel_safety_result = None
+
+# Membership set for the SUPPORTED_APPS list
+_SUPPORTED_APPS_SET = frozenset(SUPPORTED_APPS)
+
+# Per-thread COM initialization state (see _ensure_com_initialized)
+_com_state = threading.local()
+
+# COM ProgIDs of the supported Office applications
+_APP_PROGIDS = {
+    "excel": "Excel.Application",
+    "word": "Word.Application",
+    "powerpoint": "PowerPoint.Application",
+    "access": "Access.Application",
+}
+
+# How ReferenceDocuments creates and saves a new document per application. Documents
+# are only built and saved, so Word and PowerPoint create them without a window.
+_DOC_CONFIGS = {
+    "word": {
+        "doc_method": lambda app: app.Documents.Add(Visible=False),
+        "save_format": 13,  # wdFormatDocumentMacroEnabled
+    },
+    "excel": {
+        "doc_method": lambda app: app.Workbooks.Add(),
+        "save_format": 52,  # xlOpenXMLWorkbookMacroEnabled
+    },
+    "powerpoint": {
+        "doc_method": lambda app: app.Presentations.Add(WithWindow=False),
+        "save_format": 25,  # ppSaveAsOpenXMLPresentationMacroEnabled
+    },
+    "access": {
+        "doc_method": lambda app, path: app.NewCurrentDatabase(str(path)),
+        "save_format": None,  # Access doesn't use SaveAs format parameter
+    },
+}
+
+# Characters in a test node name that are replaced to build a document filename
+_TESTNAME_REPLACEMENTS = {"[": "_", "]": "", "::": "_"}
+_TESTNAME_RE = re.compile(r"\[|\]|::")
+
+# VBA source added to every reference document
+_VBA_STD_MODULE = 'Sub Test()\n    Debug.Print "Test"\nEnd Sub'
+_VBA_CLS_MODULE = (
+    '\'@Folder("Business.Domain")\n'
+    "Option Explicit\n\n"
+    "Private m_name As String\n\n"
+    "Public Property Get Name() As String\n"
+    "    Name = m_name\n"
+    "End Property\n\n"
+    "Public Property Let Name(ByVal value As String)\n"
+    "    m_name = value\n"
+    "End Property\n\n"
+    "Public Sub Initialize()\n"
+    '    Debug.Print "TestClass initialized"\n'
+    "End Sub"
+)
+
 
 def check_office_apps_are_safe_to_use():
     """Check if Office applications (Excel, Word, PowerPoint) are running.
@@ -37,38 +112,14 @@ def check_office_apps_are_safe_to_use():
     running_apps = []
     app_documents = {}
 
-    # Check Excel
-    try:
-        app = win32com.client.GetObject(Class="Excel.Application")
-        count = app.Workbooks.Count
-        running_apps.append("Excel")
-        app_documents["Excel"] = count
-    except pythoncom.com_error:
-        pass  # Not running - safe
-    except Exception:
-        pass  # Can't check - proceed
+    # Probe all apps concurrently; results come back in _SAFETY_PROBES order
+    with ThreadPoolExecutor(max_workers=len(_SAFETY_PROBES)) as executor:
+        counts = list(executor.map(lambda probe: _count_open_documents(*probe[1:]), _SAFETY_PROBES))
 
-    # Check Word
-    try:
-        app = win32com.client.GetObject(Class="Word.Application")
-        count = app.Documents.Count
-        running_apps.append("Word")
-        app_documents["Word"] = count
-    except pythoncom.com_error:
-        pass  # Not running - safe
-    except Exception:
-        pass  # Can't check - proceed
-
-    # Check PowerPoint
-    try:
-        app = win32com.client.GetObject(Class="PowerPoint.Application")
-        count = app.Presentations.Count
-        running_apps.append("PowerPoint")
-        app_documents["PowerPoint"] = count
-    except pythoncom.com_error:
-        pass  # Not running - safe
-    except Exception:
-        pass  # Can't check - proceed
+    for (app_label, _, _), count in zip(_SAFETY_PROBES, counts):
+        if count is not None:
+            running_apps.append(app_label)
+            app_documents[app_label] = count
 
     # If any Office apps are running, it's unsafe (even with 0 documents)
     if running_apps:
@@ -100,13 +151,53 @@ def check_office_apps_are_safe_to_use():
     return True, "All Office applications are closed (safe to run tests)"
 
 
+def _count_open_documents(prog_id, collection_name):
+    """Return the document count of a running Office app, or None if it is not running.
+
+    Runs in a worker thread, so it initializes (and tears down) its own COM apartment.
+    The proxy is released before CoUninitialize.
+    """
+    pythoncom.CoInitialize()
+    try:
+        try:
+            app = win32com.client.GetObject(Class=prog_id)
+            count = getattr(app, collection_name).Count
+            del app
+            return count
+        except pythoncom.com_error:
+            return None  # Not running - safe
+        except Exception:
+            return None  # Can't check - proceed
+    finally:
+        pythoncom.CoUninitialize()
+
+
 def check_excel_is_safe_to_use():
     """Legacy function for Excel-specific checks. Calls the comprehensive check.
 
+    The verdict is cached for the session: the first call sees the user's Office state,
+    while later calls (from other class-scoped fixtures) could otherwise find an
+    Excel instance left running by earlier tests.
+
     Returns:
         tuple: (is_safe: bool, message: str) - whether it's safe to proceed and a message
     """
-    return check_office_apps_are_safe_to_use()
+    global _excel_safety_result
+
+    if _excel_safety_result is None:
+        _excel_safety_result = check_office_apps_are_safe_to_use()
+    return _excel_safety_result
+
+
+def _ensure_com_initialized():
+    """Initialize COM for the calling thread, at most once per thread.
+
+    The apartment stays initialized for the lifetime of the thread; the cached
+    application proxies in _app_instances need it until cleanup_all_apps runs.
+    """
+    if not getattr(_com_state, "initialized", False):
+        pythoncom.CoInitialize()
+        _com_state.initialized = True
 
 
 def get_or_create_app(app_name: str):
@@ -122,58 +213,62 @@ def get_or_create_app(app_name: str):
 
     # Check if we have a cached instance
     if app_type in _app_instances:
-        print(f"Reusing existing {app_type} instance for test session...")
+        logger.info("Reusing existing %s instance for test session...", app_type)
         return _app_instances[app_type]
 
     # Create new instance
-    print(f"Creating {app_type} instance for test session...")
+    logger.info("Creating %s instance for test session...", app_type)
 
-    # Application configurations
-    app_configs = {
-        "excel": "Excel.Application",
-        "word": "Word.Application",
-        "powerpoint": "PowerPoint.Application",
-        "access": "Access.Application",
-    }
-
-    if app_type not in app_configs:
+    if app_type not in _APP_PROGIDS:
         raise ValueError(f"Unsupported application type: {app_type}")
 
     try:
-        # Initialize COM
-        pythoncom.CoInitialize()
+        # Initialize COM (once per thread)
+        _ensure_com_initialized()
 
-        # Create application instance
-        app = win32com.client.Dispatch(app_configs[app_type])
+        # Bind to an instance left running earlier in the session if there is one;
+        # it is already responsive, so the readiness poll can be skipped
+        try:
+            app = win32com.client.GetActiveObject(_APP_PROGIDS[app_type])
+        except pythoncom.com_error:
+            # Create application instance
+            app = win32com.client.Dispatch(_APP_PROGIDS[app_type])
 
-        # Wait for application to be ready
-        _wait_for_app_ready(app, app_type)
+            # Wait for application to be ready
+            _wait_for_app_ready(app, app_type)
 
         # Configure application
         _configure_app(app, app_type)
 
         _app_instances[app_type] = app
-        print(f"{app_type.title()} instance ready for testing")
+        logger.info("%s instance ready for testing", app_type.title())
 
     except Exception as e:
-        print(f"Failed to create {app_type} instance: {e}")
+        logger.error("Failed to create %s instance: %s", app_type, e)
         raise
 
     return _app_instances[app_type]
 
 
 def _wait_for_app_ready(app, app_type, timeout=15.0):
-    """Wait for application to be ready for operations."""
-    start_time = time.time()
+    """Wait for application to be ready for operations.
 
-    while time.time() - start_time < timeout:
+    Polls with exponential backoff (5 ms doubling up to 200 ms): an already
+    responsive app returns immediately, while a cold-starting one is not
+    flooded with failing COM calls. Any remaining start-up race is covered by
+    the retry loop in _configure_app.
+    """
+    delay = 0.005
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
         try:
             # Test basic property access to ensure app is ready
             _ = app.Name
-            time.sleep(0.2)  # Small additional delay
             return
         except Exception:
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
 
     raise RuntimeError(f"{app_type} application not ready within {timeout} seconds")
 
@@ -211,64 +306,91 @@ def _configure_app(app, app_type):
         try:
             # msoAutomationSecurityLow = 1
             app.AutomationSecurity = 1
-            print("Set Access AutomationSecurity to Low for testing")
+            logger.info("Set Access AutomationSecurity to Low for testing")
         except Exception as e:
-            print(f"Warning: Could not set Access AutomationSecurity: {e}")
+            logger.warning("Could not set Access AutomationSecurity: %s", e)
 
-    # Set properties with retry logic
+    # Set properties in one pass; the app has already answered _wait_for_app_ready,
+    # so retries are only needed for properties that actually failed
+    failed = []
     for prop_name, prop_value in properties:
-        for attempt in range(config_attempts):
+        try:
+            setattr(app, prop_name, prop_value)
+        except Exception:
+            failed.append((prop_name, prop_value))
+
+    # Retry failed properties (first retry is attempt 2 of config_attempts)
+    for prop_name, prop_value in failed:
+        for attempt in range(1, config_attempts):
+            time.sleep(0.1)
             try:
                 setattr(app, prop_name, prop_value)
                 break
             except Exception as e:
                 if attempt == config_attempts - 1:
-                    print(f"Warning: Could not set {app_type}.{prop_name}: {e}")
-                else:
-                    time.sleep(0.1)
+                    logger.warning("Could not set %s.%s: %s", app_type, prop_name, e)
 
 
 def cleanup_all_apps():
     """Clean up all application instances."""
-    global _app_instances
+    global _app_instances, _initialized
 
-    for app_type, app in _app_instances.items():
+    # Nothing left to clean up at exit; get_or_create_app registers us again if needed
+    atexit.unregister(cleanup_all_apps)
+    _initialized = False
+
+    # Pop each instance so no proxy outlives the loop, even if Office already died
+    while _app_instances:
+        app_type, app = _app_instances.popitem()
         try:
-            print(f"Closing {app_type} at end of test session...")
+            logger.info("Closing %s at end of test session...", app_type)
 
             # Close all documents first
             _close_all_documents(app, app_type)
 
             # Quit the application
             app.Quit()
-            print(f"Successfully closed {app_type}")
+            logger.info("Successfully closed %s", app_type)
 
         except Exception as e:
-            print(f"Warning: Could not quit {app_type}: {e}")
+            logger.warning("Could not quit %s: %s", app_type, e)
+        finally:
+            app = None
+
+    # Release the proxies now (not at interpreter shutdown) and let COM unload
+    # the server DLLs they kept loaded
+    gc.collect()
+    pythoncom.CoFreeUnusedLibraries()
 
-    _app_instances.clear()
+    # Balance the CoInitialize from _ensure_com_initialized; the proxies it was kept
+    # for are gone now. A later get_or_create_app initializes the thread again.
+    if getattr(_com_state, "initialized", False):
+        pythoncom.CoUninitialize()
+        _com_state.initialized = False
 
 
 def _close_all_documents(app, app_type):
     """Close all open documents for an application."""
     try:
+        # Excel and Word can close their whole document collection in one call
+        # (DisplayAlerts is off, so nothing prompts); PowerPoint has no bulk close
         if app_type == "excel":
-            while app.Workbooks.Count > 0:
-                app.Workbooks(1).Close(SaveChanges=False)
+            app.Workbooks.Close()
         elif app_type == "word":
-            while app.Documents.Count > 0:
-                app.Documents(1).Close(SaveChanges=False)
+            app.Documents.Close(SaveChanges=0)  # wdDoNotSaveChanges
         elif app_type == "powerpoint":
-            while app.Presentations.Count > 0:
-                app.Presentations(1).Close()
+            for presentation in list(app.Presentations):
+                presentation.Close()
         elif app_type == "access":
             # Access handles this differently
             try:
                 app.CloseCurrentDatabase()
             except Exception:
                 pass
+        # Drain the messages Office posts while closing before quitting it
+        pythoncom.PumpWaitingMessages()
     except Exception as e:
-        print(f"Warning: Could not close all documents for {app_type}: {e}")
+        logger.warning("Could not close all documents for %s: %s", app_type, e)
 
 
 def force_cleanup_apps():
@@ -288,36 +410,17 @@ class ReferenceDocuments:
     def __enter__(self):
         """Open the document and create a basic VBA project."""
         try:
-            app_configs = {
-                "word": {
-                    "doc_method": lambda app: app.Documents.Add(),
-                    "save_format": 13,  # wdFormatDocumentMacroEnabled
-                },
-                "excel": {
-                    "doc_method": lambda app: app.Workbooks.Add(),
-                    "save_format": 52,  # xlOpenXMLWorkbookMacroEnabled
-                },
-                "powerpoint": {
-                    "doc_method": lambda app: app.Presentations.Add(WithWindow=True),
-                    "save_format": 25,  # ppSaveAsOpenXMLPresentationMacroEnabled
-                },
-                "access": {
-                    "doc_method": lambda app, path: app.NewCurrentDatabase(str(path)),
-                    "save_format": None,  # Access doesn't use SaveAs format parameter
-                },
-            }
-
-            if self.app_type not in app_configs:
+            if self.app_type not in _DOC_CONFIGS:
                 raise ValueError(f"Unsupported application type: {self.app_type}")
 
-            config = app_configs[self.app_type]
+            config = _DOC_CONFIGS[self.app_type]
 
             # Use the session-wide application instance
             self.app = get_or_create_app(self.app_type)
 
             # Access handles document creation differently (must provide path upfront)
             if self.app_type == "access":
-                print(f"Creating new {self.app_type} document...")
+                logger.info("Creating new %s document...", self.app_type)
                 # Close any existing database first
                 try:
                     self.app.CloseCurrentDatabase()
@@ -330,12 +433,12 @@ class ReferenceDocuments:
                 # Now that database is open, disable warnings
                 try:
                     self.app.DoCmd.SetWarnings(False)
-                    print("Disabled Access warnings for open database")
+                    logger.info("Disabled Access warnings for open database")
                 except Exception as e:
-                    print(f"Warning: Could not disable Access database warnings: {e}")
+                    logger.warning("Could not disable Access database warnings: %s", e)
             else:
                 # Create new document
-                print(f"Creating new {self.app_type} document...")
+                logger.info("Creating new %s document...", self.app_type)
                 self.doc = config["doc_method"](self.app)
 
             try:
@@ -348,27 +451,12 @@ class ReferenceDocuments:
                 # Add standard module with simple test code
                 module = vba_project.VBComponents.Add(1)  # 1 = standard module
                 module.Name = "TestModule"
-                code = 'Sub Test()\n    Debug.Print "Test"\nEnd Sub'
-                module.CodeModule.AddFromString(code)
+                module.CodeModule.AddFromString(_VBA_STD_MODULE)
 
                 # Add class module with Rubberduck folder annotation
                 class_module = vba_project.VBComponents.Add(2)  # 2 = class module
                 class_module.Name = "TestClass"
-                class_code = (
-                    '\'@Folder("Business.Domain")\n'
-                    "Option Explicit\n\n"
-                    "Private m_name As String\n\n"
-                    "Public Property Get Name() As String\n"
-                    "    Name = m_name\n"
-                    "End Property\n\n"
-                    "Public Property Let Name(ByVal value As String)\n"
-                    "    m_name = value\n"
-                    "End Property\n\n"
-                    "Public Sub Initialize()\n"
-                    '    Debug.Print "TestClass initialized"\n'
-                    "End Sub"
-                )
-                class_module.CodeModule.AddFromString(class_code)
+                class_module.CodeModule.AddFromString(_VBA_CLS_MODULE)
 
             except Exception as ve:
                 raise VBAError(
@@ -383,7 +471,7 @@ class ReferenceDocuments:
             else:
                 self.doc.SaveAs(str(self.path), config["save_format"])
 
-            print(f"Created and saved {self.app_type} document: {self.path}")
+            logger.info("Created and saved %s document: %s", self.app_type, self.path)
             return self.path
 
         except Exception as e:
@@ -410,26 +498,54 @@ class ReferenceDocuments:
         self._cleanup()
 
 
+@pytest.fixture(scope="session")
+def office_doc_templates(tmp_path_factory):
+    """Session-wide cache of reference documents, one per Office application.
+
+    Creating a reference document means a full Office round-trip (add document,
+    add VBA modules, SaveAs). It is done once per application and session; tests
+    get their own copy of the closed template file (see temp_office_doc).
+
+    Returns:
+        Callable taking the application name and returning the template path
+    """
+    templates = {}
+
+    def get_template(app_type: str) -> Path:
+        if app_type not in templates:
+            extension = OFFICE_MACRO_EXTENSIONS[app_type]
+            template_path = tmp_path_factory.mktemp(f"template_{app_type}") / f"template{extension}"
+            # Create document, then close it (__exit__) so the file can be copied
+            with ReferenceDocuments(template_path, app_type) as _:
+                pass
+            templates[app_type] = template_path
+        return templates[app_type]
+
+    return get_template
+
+
 @pytest.fixture
-def temp_office_doc(tmp_path, vba_app, request):
+def temp_office_doc(tmp_path, vba_app, request, office_doc_templates):
     """Fixture providing a temporary Office document for testing."""
     extension = OFFICE_MACRO_EXTENSIONS[vba_app]
 
     # Use test node name to create unique filename for each test
-    test_name = request.node.name.replace("[", "_").replace("]", "").replace("::", "_")
+    test_name = _TESTNAME_RE.sub(lambda m: _TESTNAME_REPLACEMENTS[m.group()], request.node.name)
     doc_path = tmp_path / f"test_doc_{test_name}{extension}"
 
-    # Create document, then close it before yielding
-    with ReferenceDocuments(doc_path, vba_app) as _:
-        pass  # Document is created and saved, will be closed on __exit__
+    # Each test gets a private copy of the (closed) session template
+    shutil.copy2(office_doc_templates(vba_app), doc_path)
 
-    # Now yield the path to the closed document
     yield doc_path
 
 
 class CLITester:
     """Helper class for testing CLI interfaces."""
 
+    # Results of side-effect free invocations (see run(cacheable=True)), shared by all
+    # instances as tests usually create their own CLITester
+    _result_cache: Dict[tuple, subprocess.CompletedProcess] = {}
+
     def __init__(self, command: str):
         """Initialize with base command.
 
@@ -438,25 +554,46 @@ class CLITester:
         """
         self.command = command
         self.app_name = command.replace("-vba", "")
-
-    def run(self, args: List[str], input_text: Optional[str] = None) -> subprocess.CompletedProcess:
+        # Run the CLI module with the test interpreter rather than the console-script
+        # shim: one process instead of launcher + interpreter, and no PATH lookup
+        self._base_cmd = [sys.executable, "-m", f"vba_edit.{self.app_name}_vba"]
+
+    def run(
+        self,
+        args: List[str],
+        input_text: Optional[str] = None,
+        cacheable: bool = False,
+        merge_streams: bool = False,
+    ) -> subprocess.CompletedProcess:
         """Run CLI command with given arguments.
 
         Args:
             args: List of command arguments
             input_text: Optional input to provide to command
+            cacheable: Reuse the result of an earlier identical invocation. Only for
+                commands without side effects (e.g. --help).
+            merge_streams: Redirect stderr into stdout at the OS level, so the combined
+                output is in result.stdout (result.stderr is None)
 
         Returns:
             CompletedProcess instance with command results
         """
-        cmd = [self.command] + args
-        return subprocess.run(
+        key = (self.command, tuple(args), input_text, merge_streams)
+        if cacheable and key in self._result_cache:
+            return self._result_cache[key]
+
+        cmd = self._base_cmd + args
+        result = subprocess.run(
             cmd,
-            input=input_text.encode() if input_text else None,
-            capture_output=True,
+            input=input_text,  # text=True: passed as str, encoded once by subprocess
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_streams else subprocess.PIPE,
             text=True,
             timeout=10,  # 10 second timeout to prevent CI/CD hangs
         )
+        if cacheable:
+            self._result_cache[key] = result
+        return result
 
     def assert_success(self, args: List[str], expected_output: Optional[str] = None) -> None:
         """Assert command succeeds and optionally check output.
@@ -465,8 +602,8 @@ class CLITester:
             args: Command arguments
             expected_output: Optional string to check in output
         """
-        result = self.run(args)
-        full_output = result.stdout + result.stderr
+        result = self.run(args, merge_streams=True)
+        full_output = result.stdout
         # Consider success if either return code is 0 or it's an empty VBA project
         success = result.returncode == 0 or "No VBA components found" in full_output
         assert success, f"Command failed with output: {full_output}"
@@ -480,32 +617,74 @@ class CLITester:
             args: Command arguments
             expected_error: Error message to check for
         """
-        result = self.run(args)
+        result = self.run(args, merge_streams=True)
         assert result.returncode != 0, "Command should have failed"
-        full_output = result.stdout + result.stderr
+        full_output = result.stdout
         assert expected_error in full_output, f"Expected error '{expected_error}' not found in output"
 
 
+# Results of _check_app_available, probed at most once per app and session
+_app_available_cache: Dict[str, bool] = {}
+
+
 def get_installed_apps(selected_apps=None) -> List[str]:
     """Get list of supported apps that are installed."""
     if selected_apps is None:
         selected_apps = ["excel", "word", "access"]
 
-    return [app for app in selected_apps if app in SUPPORTED_APPS and _check_app_available(app)]
+    candidates = [app for app in selected_apps if app in _SUPPORTED_APPS_SET]
+
+    # Probe uncached apps concurrently - each probe is a process launch, not CPU work
+    missing = [app for app in candidates if app not in _app_available_cache]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            for app, available in zip(missing, executor.map(_probe_app_available, missing)):
+                _app_available_cache[app] = available
+
+    return [app for app in candidates if _check_app_available(app)]
 
 
 def _check_app_available(app_name: str) -> bool:
     """Check if an Office app is available without using COM.
 
+    Results are cached for the session, as this is called for every parametrized test.
+
     Args:
         app_name: Name of Office application to check
 
     Returns:
         True if app is available, False otherwise
     """
+    if app_name not in _app_available_cache:
+        _app_available_cache[app_name] = _probe_app_available(app_name)
+    return _app_available_cache[app_name]
+
+
+def _probe_app_available(app_name: str) -> bool:
+    """Run the CLI entry point for an Office app to see if it is usable.
+
+    Args:
+        app_name: Name of Office application to check
+
+    Returns:
+        True if the CLI ran successfully, False otherwise
+    """
+    command = f"{app_name}-vba"
+
+    # An entry point that is not on PATH cannot run - skip the process launch
+    if shutil.which(command) is None:
+        return False
+
     try:
-        cmd = [f"{app_name}-vba", "--help"]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        cmd = [command, "--help"]
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            # Don't allocate a console window per probe on Windows
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
         return result.returncode == 0
     except Exception:
         return False
@@ -47,7 +47,7 @@ class TestCLIBasic:
         cli = CLITester(f"{vba_app}-vba")
 
         # Test that help shows the rubberduck option
-        result = cli.run(["export", "--help"])
+        result = cli.run(["export", "--help"], cacheable=True)
         assert "--rubberduck-folders" in result.stdout
 
         # Test that the option is accepted
@@ -61,7 +61,7 @@ class TestCLIBasic:
 
         # Test that --conf option works in subcommands
         for cmd in ["export", "import", "edit"]:
-            result = cli.run([cmd, "--help"])
+            result = cli.run([cmd, "--help"], cacheable=True)
             assert "--conf" in result.stdout or "--config" in result.stdout
             assert result.returncode == 0
 
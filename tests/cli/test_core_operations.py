@@ -20,12 +20,61 @@ You will need to click "OK" on module name confirmation dialogs during test exec
 """
 
 import json
+import os
+import shutil
 import time
 from pathlib import Path
 
 import pytest
 
-from .helpers import CLITester, temp_office_doc
+from vba_edit.office_vba import VBATypes
+
+from .helpers import CLITester, get_or_create_app, temp_office_doc
+
+# Document collection, extension and SaveAs format of the apps in the UserForm test
+_USERFORM_DOC_FORMATS = {
+    "excel": ("Workbooks", "xlsm", 52),  # xlOpenXMLWorkbookMacroEnabled
+    "word": ("Documents", "docm", 13),  # wdFormatXMLDocumentMacroEnabled
+    "powerpoint": ("Presentations", "pptm", 24),  # ppSaveAsOpenXMLPresentationMacroEnabled
+}
+
+# Extensions of the modules every reference document exports
+_VBA_MODULE_EXTENSIONS = frozenset({".bas", ".cls"})
+
+
+def _dir_has_vba_files(path):
+    """Return True if path directly contains an exported standard or class module."""
+    with os.scandir(path) as entries:
+        return any(os.path.splitext(entry.name)[1] in _VBA_MODULE_EXTENSIONS for entry in entries)
+
+
+def _link_or_copy(src, dst):
+    """Place a per-test document at dst, hard-linking it where the filesystem allows.
+
+    The source is the test's private copy of the reference document, so sharing its
+    data is safe; filesystems without hard links (FAT, some network shares) get a copy.
+    """
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy(src, dst)
+
+
+def _wait_until_file_released(path, timeout=5.0):
+    """Poll until path can be opened for writing, i.e. Office no longer has it open.
+
+    Returns as soon as the file is free (normally right away, as the CLI process has
+    exited) instead of always sleeping for the worst case.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with open(path, "r+b"):
+                return
+        except PermissionError:
+            if time.monotonic() >= deadline:
+                return  # Let the caller's Open report the problem
+            time.sleep(0.05)
 
 
 class TestCorePathResolution:
@@ -35,7 +84,7 @@ class TestCorePathResolution:
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.skip_access  # Access requires user interaction for module import
-    def test_export_with_relative_vba_directory(self, vba_app, temp_office_doc, tmp_path):
+    def test_export_with_relative_vba_directory(self, vba_app, temp_office_doc, tmp_path, monkeypatch):
         """Test export with relative --vba-directory doesn't double paths.
 
         This test would have caught Bug #1 where paths were doubled:
@@ -56,52 +105,54 @@ class TestCorePathResolution:
         vba_dir = tmp_path / "vba"
 
         # Copy test doc to docs folder
-        import shutil
-
         test_doc = docs_dir / temp_office_doc.name
-        shutil.copy(temp_office_doc, test_doc)
+        _link_or_copy(temp_office_doc, test_doc)
 
         # Export using relative path from current directory
         # Change to docs directory so ../vba is relative
-        import os
+        monkeypatch.chdir(docs_dir)
 
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(docs_dir)
-
-            # Export with relative path
-            cli.assert_success(
-                ["export", "-f", str(test_doc), "--vba-directory", "../vba", "--force-overwrite", "--keep-open"]
-            )
+        # Export with relative path
+        cli.assert_success(
+            ["export", "-f", str(test_doc), "--vba-directory", "../vba", "--force-overwrite", "--keep-open"]
+        )
 
-            # Verify VBA dir is at correct location (not doubled)
-            assert vba_dir.exists(), "VBA directory should exist at tmp_path/vba"
+        # Verify VBA dir is at correct location (not doubled)
+        assert vba_dir.exists(), "VBA directory should exist at tmp_path/vba"
 
-            # Verify it's NOT at the wrong (doubled) location
-            wrong_path = docs_dir / "docs" / "vba"
-            assert not wrong_path.exists(), "VBA directory should NOT be at doubled path"
+        # Verify it's NOT at the wrong (doubled) location
+        wrong_path = docs_dir / "docs" / "vba"
+        assert not wrong_path.exists(), "VBA directory should NOT be at doubled path"
 
-            # Verify actual VBA files are in the correct location
-            vba_files = list(vba_dir.glob("*.bas")) + list(vba_dir.glob("*.cls"))
-            assert len(vba_files) > 0, "Should have exported at least one VBA file"
+        # Verify actual VBA files are in the correct location
+        assert _dir_has_vba_files(vba_dir), "Should have exported at least one VBA file"
 
-            # Verify the path stored in metadata is correct
-            metadata_file = vba_dir / "vba_metadata.json"
-            if metadata_file.exists():
-                metadata = json.loads(metadata_file.read_text())
-                # The path should be resolved correctly, not doubled
-                assert "vba" not in str(metadata).lower().count("vba") > 2, (
-                    "Metadata should not contain doubled 'vba' path components"
+        # Verify the path stored in metadata is correct (metadata is optional)
+        metadata_file = vba_dir / "vba_metadata.json"
+        try:
+            metadata = json.loads(metadata_file.read_bytes())
+        except FileNotFoundError:
+            metadata = None
+        if metadata is not None:
+            # The paths should be resolved correctly, not doubled. Compare the recorded
+            # paths themselves: counting "vba" in the whole path would also count the
+            # pytest tmp directory, which is named after this test.
+            vba_path = metadata.get("vba_directory", "")
+            if vba_path:
+                assert Path(vba_path).resolve() == vba_dir.resolve(), (
+                    f"Metadata vba_directory should not be doubled: {vba_path!r}"
+                )
+            source_document = metadata.get("source_document", "")
+            if source_document:
+                assert Path(source_document).resolve() == test_doc.resolve(), (
+                    f"Metadata source_document should not be doubled: {source_document!r}"
                 )
-
-        finally:
-            os.chdir(original_cwd)
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.skip_access  # Access requires user interaction for module import
-    def test_export_to_parent_directory(self, vba_app, temp_office_doc, tmp_path):
+    def test_export_to_parent_directory(self, vba_app, temp_office_doc, tmp_path, monkeypatch):
         """Test export with ../ in --vba-directory works correctly."""
         cli = CLITester(f"{vba_app}-vba")
 
@@ -110,30 +161,21 @@ class TestCorePathResolution:
         subdir = tmp_path / "subdir"
         subdir.mkdir()
 
-        import shutil
-
         test_doc = subdir / temp_office_doc.name
-        shutil.copy(temp_office_doc, test_doc)
+        _link_or_copy(temp_office_doc, test_doc)
 
         vba_dir = tmp_path / "vba"
 
         # Export with relative parent path
-        import os
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(subdir)
-
-            cli.assert_success(
-                ["export", "-f", str(test_doc), "--vba-directory", "../vba", "--force-overwrite", "--keep-open"]
-            )
+        monkeypatch.chdir(subdir)
 
-            # Verify correct location
-            assert vba_dir.exists()
-            assert any(vba_dir.glob("*.bas")) or any(vba_dir.glob("*.cls"))
+        cli.assert_success(
+            ["export", "-f", str(test_doc), "--vba-directory", "../vba", "--force-overwrite", "--keep-open"]
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        # Verify correct location
+        assert vba_dir.exists()
+        assert _dir_has_vba_files(vba_dir)
 
 
 class TestCoreUserFormHandling:
@@ -162,45 +204,35 @@ class TestCoreUserFormHandling:
         - WRONG: temp_file = self.vba_dir / f"{name}.tmp"
         - RIGHT: temp_file = self.vba_dir / f"{name}_temp{file_extension}"
         """
-        import win32com.client
-        from vba_edit.office_vba import VBATypes
-
         # Skip if app doesn't support UserForms well
         if vba_app == "access":
             pytest.skip("Access has different form handling")
 
         cli = CLITester(f"{vba_app}-vba")
 
-        # Create a document with a UserForm
-        app_map = {
-            "excel": ("Excel.Application", "Workbooks", "xlsm", 52),  # xlOpenXMLWorkbookMacroEnabled
-            "word": ("Word.Application", "Documents", "docm", 13),  # wdFormatXMLDocumentMacroEnabled
-            "powerpoint": (
-                "PowerPoint.Application",
-                "Presentations",
-                "pptm",
-                24,
-            ),  # ppSaveAsOpenXMLPresentationMacroEnabled
-        }
-
-        if vba_app not in app_map:
+        if vba_app not in _USERFORM_DOC_FORMATS:
             pytest.skip(f"UserForm test not configured for {vba_app}")
 
-        app_class, collection_name, ext, file_format = app_map[vba_app]
+        collection_name, ext, file_format = _USERFORM_DOC_FORMATS[vba_app]
 
         # Create test document with UserForm
         test_file = tmp_path / f"test_userform.{ext}"
         vba_dir = tmp_path / "vba"
 
-        # === PHASE 1: Create document with UserForm ===
-        app = None
+        def close_doc(doc):
+            # PowerPoint's Close takes no SaveChanges argument
+            if vba_app == "powerpoint":
+                doc.Close()
+            else:
+                doc.Close(SaveChanges=False)
+
+        # One conversation with the session-wide application instance: only the
+        # document is opened and closed between phases
+        app = get_or_create_app(vba_app)
+        collection = getattr(app, collection_name)
         doc = None
         try:
-            app = win32com.client.Dispatch(app_class)
-            if vba_app != "powerpoint":
-                app.Visible = False
-
-            collection = getattr(app, collection_name)
+            # === PHASE 1: Create document with UserForm ===
             doc = collection.Add()
 
             # Add a UserForm
@@ -216,77 +248,40 @@ class TestCoreUserFormHandling:
             # Save the document with correct format
             doc.SaveAs(str(test_file), FileFormat=file_format)
 
-            # Close and cleanup - CRITICAL: Must release all COM objects before next phase
-            if vba_app == "powerpoint":
-                doc.Close()
-            else:
-                doc.Close(SaveChanges=False)
+            # Close the document so the CLI can open the saved file
+            close_doc(doc)
             doc = None
 
-            app.Quit()
-            app = None
-
-            # Give Office time to fully release COM objects
-            time.sleep(1.0)
-
-        finally:
-            # Emergency cleanup if something went wrong
-            try:
-                if doc is not None:
-                    if vba_app == "powerpoint":
-                        doc.Close()
-                    else:
-                        doc.Close(SaveChanges=False)
-                    doc = None
-            except Exception:
-                pass
-            try:
-                if app is not None:
-                    app.Quit()
-                    app = None
-            except Exception:
-                pass
-
-        # === PHASE 2: Export and modify (no COM required) ===
-        # Export with in-file headers (triggers the bug this test catches)
-        cli.assert_success(
-            [
-                "export",
-                "-f",
-                str(test_file),
-                "--vba-directory",
-                str(vba_dir),
-                "--in-file-headers",
-                "--force-overwrite",
-                "--keep-open",
-            ]
-        )
+            # === PHASE 2: Export and modify (no COM required) ===
+            # Export with in-file headers (triggers the bug this test catches)
+            cli.assert_success(
+                [
+                    "export",
+                    "-f",
+                    str(test_file),
+                    "--vba-directory",
+                    str(vba_dir),
+                    "--in-file-headers",
+                    "--force-overwrite",
+                    "--keep-open",
+                ]
+            )
 
-        # Verify UserForm was exported
-        userform_file = vba_dir / "TestUserForm.frm"
-        assert userform_file.exists(), "UserForm should be exported as .frm file"
+            # Verify UserForm was exported
+            userform_file = vba_dir / "TestUserForm.frm"
+            assert userform_file.exists(), "UserForm should be exported as .frm file"
 
-        # Modify the UserForm file
-        content = userform_file.read_text(encoding="cp1252")
-        modified_content = content.replace("' Test", "' Modified")
-        userform_file.write_text(modified_content, encoding="cp1252")
+            # Modify the UserForm file (ASCII edit, so the cp1252 bytes can be patched directly)
+            content = userform_file.read_bytes()
+            userform_file.write_bytes(content.replace(b"' Test", b"' Modified"))
 
-        # === PHASE 3: Import back (CLI handles COM) ===
-        cli.assert_success(["import", "-f", str(test_file), "--vba-directory", str(vba_dir), "--in-file-headers"])
+            # === PHASE 3: Import back (CLI handles COM) ===
+            cli.assert_success(["import", "-f", str(test_file), "--vba-directory", str(vba_dir), "--in-file-headers"])
 
-        # Give the import command time to complete and release COM
-        time.sleep(1.0)
+            # Wait until no Office process holds the file open any more
+            _wait_until_file_released(test_file)
 
-        # === PHASE 4: Verify results ===
-        app = None
-        doc = None
-        try:
-            # Open a fresh app instance for verification
-            app = win32com.client.Dispatch(app_class)
-            if vba_app != "powerpoint":
-                app.Visible = False
-
-            collection = getattr(app, collection_name)
+            # === PHASE 4: Verify results ===
             doc = collection.Open(str(test_file))
 
             # Access VBA project
@@ -301,16 +296,10 @@ class TestCoreUserFormHandling:
             code = component.CodeModule.Lines(1, component.CodeModule.CountOfLines)
             has_modified = "Modified" in code
 
-            # Close everything before assertions (avoid hanging if assertion fails)
-            if vba_app == "powerpoint":
-                doc.Close()
-            else:
-                doc.Close(SaveChanges=False)
+            # Close the document before assertions (avoid hanging if assertion fails)
+            close_doc(doc)
             doc = None
 
-            app.Quit()
-            app = None
-
             # Now safe to assert
             assert actual_type == VBATypes.VBEXT_CT_MSFORM, (
                 f"TestUserForm should be VBEXT_CT_MSFORM ({VBATypes.VBEXT_CT_MSFORM}), but is type {actual_type}"
@@ -318,18 +307,10 @@ class TestCoreUserFormHandling:
             assert has_modified, "Modified code should be imported"
 
         finally:
-            # Final cleanup
+            # Emergency cleanup if something went wrong; the app stays up for the session
             try:
                 if doc is not None:
-                    if vba_app == "powerpoint":
-                        doc.Close()
-                    else:
-                        doc.Close(SaveChanges=False)
-            except Exception:
-                pass
-            try:
-                if app is not None:
-                    app.Quit()
+                    close_doc(doc)
             except Exception:
                 pass
 
@@ -394,9 +375,6 @@ class TestAppSpecificOperations:
     @pytest.mark.powerpoint
     def test_powerpoint_basic_export_import(self, vba_app, temp_office_doc, tmp_path):
         """Test basic PowerPoint export/import works."""
-        if vba_app != "powerpoint":
-            pytest.skip("PowerPoint-specific test")
-
         cli = CLITester("powerpoint-vba")
         vba_dir = tmp_path / "vba"
 
@@ -415,9 +393,6 @@ class TestAppSpecificOperations:
     @pytest.mark.skip_access  # Access requires user interaction for module import
     def test_access_basic_export_import(self, vba_app, temp_office_doc, tmp_path):
         """Test basic Access export/import works."""
-        if vba_app != "access":
-            pytest.skip("Access-specific test")
-
         cli = CLITester("access-vba")
         vba_dir = tmp_path / "vba"
 
@@ -5,11 +5,14 @@ Focus: Line-by-line code accuracy, not headers/metadata.
 
 Test Strategy:
 - Use 150+ line code modules for meaningful testing
-- Test first 3 lines, middle 3 lines, last 3 lines specifically
+- Compare exports line for line; check first, middle and last 3 lines after import
 - Focus on cp1252 encoding (Windows default)
 - Test all Excel component types: ThisWorkbook, Sheet, Module, Class, UserForm
 """
 
+import difflib
+import logging
+import re
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -18,9 +21,491 @@ import pytest
 import win32com.client
 
 from vba_edit.exceptions import VBAError
-from vba_edit.office_vba import VBADocumentNames
 from .helpers import CLITester, get_or_create_app
 
+logger = logging.getLogger(__name__)
+
+# Prefixes of the header lines that extract_code_lines skips; every Attribute line
+# (VB_Name, VB_GlobalNameSpace, VB_Creatable, ...) counts as a header
+_HEADER_PREFIXES = ("VERSION", "BEGIN", "END", "Attribute")
+
+# Header lines that must never end up in a module's code after import
+_HEADER_LINE_RE = re.compile(r"\s*(?:VERSION|BEGIN|END\s*$|MultiUse|Attribute VB_.*=)")
+
+# 150+ line test code for the standard module
+_STANDARD_MODULE_CODE = "\n".join(
+    [
+        'Attribute VB_Name = "TestModule"',
+        "Option Explicit",
+        "",
+        "' Test module with 150+ lines for data fidelity testing",
+        "' Contains special characters: äöüÄÖÜß € £ ¥",
+        '\' Contains quotes: ""double"" and apostrophes',
+        "",
+        'Public Const APP_NAME As String = "Test Application"',
+        'Public Const APP_VERSION As String = "1.0.0"',
+        "Public Const MAX_ITEMS As Long = 1000",
+        "",
+        "Private m_counter As Long",
+        "Private m_lastError As String",
+        "",
+        "' Initialize module",
+        "Public Sub Initialize()",
+        "    m_counter = 0",
+        '    m_lastError = ""',
+        '    Debug.Print "Module initialized at " & Now()',
+        "End Sub",
+        "",
+        "' Main processing function",
+        "Public Function ProcessData(ByVal input As String) As Boolean",
+        "    On Error GoTo ErrorHandler",
+        "    ",
+        "    Dim result As String",
+        "    Dim i As Long",
+        "    ",
+        "    ' Validate input",
+        "    If Len(input) = 0 Then",
+        '        m_lastError = "Input cannot be empty"',
+        "        ProcessData = False",
+        "        Exit Function",
+        "    End If",
+        "    ",
+        "    ' Process each character",
+        "    For i = 1 To Len(input)",
+        "        result = result & Mid(input, i, 1)",
+        "        m_counter = m_counter + 1",
+        "    Next i",
+        "    ",
+        "    ProcessData = True",
+        "    Exit Function",
+        "    ",
+        "ErrorHandler:",
+        '    m_lastError = "Error: " & Err.Description',
+        "    ProcessData = False",
+        "End Function",
+        "",
+        "' Calculate sum of array",
+        "Public Function CalculateSum(ByRef values() As Double) As Double",
+        "    Dim total As Double",
+        "    Dim i As Long",
+        "    ",
+        "    total = 0",
+        "    For i = LBound(values) To UBound(values)",
+        "        total = total + values(i)",
+        "    Next i",
+        "    ",
+        "    CalculateSum = total",
+        "End Function",
+        "",
+        "' Format currency with special characters",
+        "Public Function FormatCurrency(ByVal amount As Double, ByVal currency As String) As String",
+        "    Select Case currency",
+        '        Case "EUR"',
+        '            FormatCurrency = Format(amount, "#,##0.00") & " €"',
+        '        Case "GBP"',
+        '            FormatCurrency = "£" & Format(amount, "#,##0.00")',
+        '        Case "JPY"',
+        '            FormatCurrency = "¥" & Format(amount, "#,##0")',
+        "        Case Else",
+        '            FormatCurrency = Format(amount, "#,##0.00")',
+        "    End Select",
+        "End Function",
+        "",
+        "' Test German umlauts",
+        "Public Sub TestGermanCharacters()",
+        "    Dim text As String",
+        '    text = "Größe: groß, Maße: messen, Äpfel: Äpfel"',
+        '    text = text & vbCrLf & "Übung macht den Meister"',
+        '    text = text & vbCrLf & "Ökologie und Ökonomie"',
+        "    Debug.Print text",
+        "End Sub",
+        "",
+        "' Validate email address",
+        "Public Function IsValidEmail(ByVal email As String) As Boolean",
+        "    Dim atPos As Long",
+        "    Dim dotPos As Long",
+        "    ",
+        '    atPos = InStr(email, "@")',
+        "    If atPos = 0 Then",
+        "        IsValidEmail = False",
+        "        Exit Function",
+        "    End If",
+        "    ",
+        '    dotPos = InStrRev(email, ".")',
+        "    If dotPos = 0 Or dotPos < atPos Then",
+        "        IsValidEmail = False",
+        "        Exit Function",
+        "    End If",
+        "    ",
+        "    IsValidEmail = True",
+        "End Function",
+        "",
+        "' Get weekday name in German",
+        "Public Function GetWeekdayNameDE(ByVal weekday As Long) As String",
+        "    Select Case weekday",
+        '        Case 1: GetWeekdayNameDE = "Sonntag"',
+        '        Case 2: GetWeekdayNameDE = "Montag"',
+        '        Case 3: GetWeekdayNameDE = "Dienstag"',
+        '        Case 4: GetWeekdayNameDE = "Mittwoch"',
+        '        Case 5: GetWeekdayNameDE = "Donnerstag"',
+        '        Case 6: GetWeekdayNameDE = "Freitag"',
+        '        Case 7: GetWeekdayNameDE = "Samstag"',
+        '        Case Else: GetWeekdayNameDE = "Ungültig"',
+        "    End Select",
+        "End Function",
+        "",
+        "' Complex calculation with error handling",
+        "Public Function ComplexCalculation(ByVal x As Double, ByVal y As Double) As Double",
+        "    On Error GoTo ErrorHandler",
+        "    ",
+        "    Dim result As Double",
+        "    Dim temp As Double",
+        "    ",
+        "    ' Step 1: Validate inputs",
+        "    If x = 0 Then",
+        '        Err.Raise vbObjectError + 1000, , "X cannot be zero"',
+        "    End If",
+        "    ",
+        "    ' Step 2: Calculate intermediate value",
+        "    temp = (x * x + y * y) / x",
+        "    ",
+        "    ' Step 3: Apply formula",
+        "    result = temp * 3.14159265358979",
+        "    ",
+        "    ' Step 4: Return result",
+        "    ComplexCalculation = result",
+        "    Exit Function",
+        "    ",
+        "ErrorHandler:",
+        '    Debug.Print "Error in ComplexCalculation: " & Err.Description',
+        "    ComplexCalculation = 0",
+        "End Function",
+        "",
+        "' Generate report with special formatting",
+        "Public Sub GenerateReport()",
+        "    Dim report As String",
+        "    Dim i As Long",
+        "    ",
+        '    report = "╔═══════════════════════════════════╗" & vbCrLf',
+        '    report = report & "║     MONTHLY REPORT - " & Format(Now, "MMM YYYY") & "    ║" & vbCrLf',
+        '    report = report & "╠═══════════════════════════════════╣" & vbCrLf',
+        "    ",
+        "    For i = 1 To 10",
+        '        report = report & "║ Item " & i & ": € " & Format(i * 100, "#,##0.00") & Space(20 - Len(CStr(i))) & "║" & vbCrLf',
+        "    Next i",
+        "    ",
+        '    report = report & "╚═══════════════════════════════════╝"',
+        "    ",
+        "    Debug.Print report",
+        "End Sub",
+        "",
+        "' Test line endings and whitespace",
+        "Public Sub TestWhitespace()",
+        "    Dim text As String",
+        "    ",
+        "    ' Line with trailing spaces",
+        '    text = "Line 1    "',
+        "    ",
+        "    ' Line with tab character",
+        '    text = text & vbTab & "Tabbed text" & vbTab',
+        "    ",
+        "    ' Line with mixed spaces and tabs",
+        '    text = text & "  " & vbTab & "  Mixed"',
+        "    ",
+        "    Debug.Print text",
+        "End Sub",
+        "",
+        "' Last function - important for testing end of file",
+        "Public Function GetLastLine() As String",
+        '    GetLastLine = "This is the last line of the module"',
+        "End Function",
+    ]
+)
+
+
+# 150+ line test code for the class module.
+# Does NOT include VBA headers (VERSION, BEGIN, END, Attribute lines); these are
+# managed by VBA when using AddFromString().
+_CLASS_MODULE_CODE = "\n".join(
+    [
+        "Option Explicit",
+        "",
+        "' Class module for testing data fidelity",
+        "' Tests property procedures, private members, and class behavior",
+        "",
+        "' Private member variables",
+        "Private m_name As String",
+        "Private m_value As Double",
+        "Private m_isActive As Boolean",
+        "Private m_created As Date",
+        "Private m_description As String",
+        "Private m_tags As Collection",
+        "",
+        "' Constants",
+        'Private Const DEFAULT_NAME As String = "Unnamed"',
+        "Private Const MAX_VALUE As Double = 999999.99",
+        "Private Const MIN_VALUE As Double = -999999.99",
+        "",
+        "' Class initialization",
+        "Private Sub Class_Initialize()",
+        "    m_name = DEFAULT_NAME",
+        "    m_value = 0",
+        "    m_isActive = True",
+        "    m_created = Now()",
+        '    m_description = ""',
+        "    Set m_tags = New Collection",
+        "    ",
+        '    Debug.Print "TestClass instance created at " & m_created',
+        "End Sub",
+        "",
+        "' Class termination",
+        "Private Sub Class_Terminate()",
+        "    Set m_tags = Nothing",
+        '    Debug.Print "TestClass instance destroyed"',
+        "End Sub",
+        "",
+        "' Name property - Get",
+        "Public Property Get Name() As String",
+        "    Name = m_name",
+        "End Property",
+        "",
+        "' Name property - Let",
+        "Public Property Let Name(ByVal newName As String)",
+        "    If Len(newName) = 0 Then",
+        '        Err.Raise vbObjectError + 1001, "TestClass", "Name cannot be empty"',
+        "    End If",
+        "    ",
+        "    m_name = newName",
+        "End Property",
+        "",
+        "' Value property - Get",
+        "Public Property Get Value() As Double",
+        "    Value = m_value",
+        "End Property",
+        "",
+        "' Value property - Let with validation",
+        "Public Property Let Value(ByVal newValue As Double)",
+        "    If newValue < MIN_VALUE Then",
+        '        Err.Raise vbObjectError + 1002, "TestClass", "Value too small"',
+        "    End If",
+        "    ",
+        "    If newValue > MAX_VALUE Then",
+        '        Err.Raise vbObjectError + 1003, "TestClass", "Value too large"',
+        "    End If",
+        "    ",
+        "    m_value = newValue",
+        "End Property",
+        "",
+        "' IsActive property - Get",
+        "Public Property Get IsActive() As Boolean",
+        "    IsActive = m_isActive",
+        "End Property",
+        "",
+        "' IsActive property - Let",
+        "Public Property Let IsActive(ByVal newStatus As Boolean)",
+        "    m_isActive = newStatus",
+        "    ",
+        "    If m_isActive Then",
+        '        Debug.Print m_name & " activated"',
+        "    Else",
+        '        Debug.Print m_name & " deactivated"',
+        "    End If",
+        "End Property",
+        "",
+        "' Created property - Get (read-only)",
+        "Public Property Get Created() As Date",
+        "    Created = m_created",
+        "End Property",
+        "",
+        "' Description property - Get",
+        "Public Property Get Description() As String",
+        "    Description = m_description",
+        "End Property",
+        "",
+        "' Description property - Let",
+        "Public Property Let Description(ByVal newDescription As String)",
+        "    m_description = newDescription",
+        "End Property",
+        "",
+        "' Add tag to collection",
+        "Public Sub AddTag(ByVal tag As String)",
+        "    On Error Resume Next",
+        "    m_tags.Add tag, tag  ' Key is tag itself for uniqueness",
+        "    ",
+        "    If Err.Number = 0 Then",
+        '        Debug.Print "Tag added: " & tag',
+        "    Else",
+        '        Debug.Print "Tag already exists: " & tag',
+        "    End If",
+        "    ",
+        "    On Error GoTo 0",
+        "End Sub",
+        "",
+        "' Remove tag from collection",
+        "Public Sub RemoveTag(ByVal tag As String)",
+        "    On Error Resume Next",
+        "    m_tags.Remove tag",
+        "    ",
+        "    If Err.Number = 0 Then",
+        '        Debug.Print "Tag removed: " & tag',
+        "    Else",
+        '        Debug.Print "Tag not found: " & tag',
+        "    End If",
+        "    ",
+        "    On Error GoTo 0",
+        "End Sub",
+        "",
+        "' Check if tag exists",
+        "Public Function HasTag(ByVal tag As String) As Boolean",
+        "    Dim item As Variant",
+        "    ",
+        "    On Error Resume Next",
+        "    item = m_tags(tag)",
+        "    HasTag = (Err.Number = 0)",
+        "    On Error GoTo 0",
+        "End Function",
+        "",
+        "' Get all tags as array",
+        "Public Function GetTags() As String()",
+        "    Dim tags() As String",
+        "    Dim i As Long",
+        "    Dim item As Variant",
+        "    ",
+        "    If m_tags.Count = 0 Then",
+        '        GetTags = Split("", ",")  \' Empty array',
+        "        Exit Function",
+        "    End If",
+        "    ",
+        "    ReDim tags(1 To m_tags.Count)",
+        "    ",
+        "    i = 1",
+        "    For Each item In m_tags",
+        "        tags(i) = CStr(item)",
+        "        i = i + 1",
+        "    Next item",
+        "    ",
+        "    GetTags = tags",
+        "End Function",
+        "",
+        "' Validate object state",
+        "Public Function Validate() As Boolean",
+        "    Dim isValid As Boolean",
+        "    ",
+        "    isValid = True",
+        "    ",
+        "    ' Check name",
+        "    If Len(m_name) = 0 Then",
+        '        Debug.Print "Validation error: Name is empty"',
+        "        isValid = False",
+        "    End If",
+        "    ",
+        "    ' Check value range",
+        "    If m_value < MIN_VALUE Or m_value > MAX_VALUE Then",
+        '        Debug.Print "Validation error: Value out of range"',
+        "        isValid = False",
+        "    End If",
+        "    ",
+        "    Validate = isValid",
+        "End Function",
+        "",
+        "' Clone this object",
+        "Public Function Clone() As TestClass",
+        "    Dim newObj As New TestClass",
+        "    ",
+        "    newObj.Name = m_name",
+        "    newObj.Value = m_value",
+        "    newObj.IsActive = m_isActive",
+        "    newObj.Description = m_description",
+        "    ",
+        "    ' Copy tags",
+        "    Dim tag As Variant",
+        "    For Each tag In m_tags",
+        "        newObj.AddTag CStr(tag)",
+        "    Next tag",
+        "    ",
+        "    Set Clone = newObj",
+        "End Function",
+        "",
+        "' Export to formatted string",
+        "Public Function ToString() As String",
+        "    Dim result As String",
+        "    ",
+        '    result = "TestClass Object" & vbCrLf',
+        '    result = result & "  Name: " & m_name & vbCrLf',
+        '    result = result & "  Value: " & Format(m_value, "#,##0.00") & vbCrLf',
+        '    result = result & "  Active: " & m_isActive & vbCrLf',
+        '    result = result & "  Created: " & Format(m_created, "yyyy-mm-dd hh:nn:ss") & vbCrLf',
+        '    result = result & "  Tags: " & m_tags.Count',
+        "    ",
+        "    ToString = result",
+        "End Function",
+        "",
+        "' Final method - tests end of class",
+        "Public Sub Finalize()",
+        '    Debug.Print "Finalizing " & m_name',
+        "    m_isActive = False",
+        "End Sub",
+    ]
+)
+
+
+# Test code for the ThisWorkbook document module
+_THISWORKBOOK_CODE = "\n".join(
+    [
+        "Option Explicit",
+        "",
+        "' ThisWorkbook module - Document-level code",
+        "' This must be imported to the ThisWorkbook document module, not as a separate module",
+        "",
+        "Private Sub Workbook_Open()",
+        '    MsgBox "Workbook opened at " & Now(), vbInformation',
+        '    Debug.Print "Workbook_Open event fired"',
+        "End Sub",
+        "",
+        "Private Sub Workbook_BeforeClose(Cancel As Boolean)",
+        "    Dim response As VbMsgBoxResult",
+        "    ",
+        '    response = MsgBox("Save changes before closing?", vbYesNoCancel)',
+        "    ",
+        "    Select Case response",
+        "        Case vbYes",
+        "            ThisWorkbook.Save",
+        "        Case vbCancel",
+        "            Cancel = True",
+        "    End Select",
+        "End Sub",
+        "",
+        "Private Sub Workbook_BeforeSave(ByVal SaveAsUI As Boolean, Cancel As Boolean)",
+        '    Debug.Print "Saving workbook at " & Now()',
+        "End Sub",
+        "",
+        "Public Function GetWorkbookInfo() As String",
+        "    Dim info As String",
+        "    ",
+        '    info = "Workbook: " & ThisWorkbook.Name & vbCrLf',
+        '    info = info & "Path: " & ThisWorkbook.Path & vbCrLf',
+        '    info = info & "Sheets: " & ThisWorkbook.Worksheets.Count & vbCrLf',
+        '    info = info & "Created: " & ThisWorkbook.BuiltinDocumentProperties("Creation Date")',
+        "    ",
+        "    GetWorkbookInfo = info",
+        "End Function",
+        "",
+        "Public Sub RefreshAllData()",
+        "    Dim ws As Worksheet",
+        "    ",
+        "    Application.ScreenUpdating = False",
+        "    ",
+        "    For Each ws In ThisWorkbook.Worksheets",
+        "        ws.Calculate",
+        "    Next ws",
+        "    ",
+        "    Application.ScreenUpdating = True",
+        "    ",
+        '    MsgBox "All data refreshed", vbInformation',
+        "End Sub",
+    ]
+)
+
 
 class TestExcelDataFidelity:
     """Test VBA code data fidelity through export/import operations."""
@@ -51,6 +536,11 @@ class TestExcelDataFidelity:
 
         return app
 
+    @pytest.fixture(scope="class")
+    def cli(self):
+        """CLI tester for excel-vba, shared by the tests in this class."""
+        return CLITester("excel-vba")
+
     @pytest.fixture
     def test_workbook(self, excel_app, tmp_path, request):
         """Create a test workbook with VBA components.
@@ -66,26 +556,43 @@ class TestExcelDataFidelity:
         excel_app.DisplayAlerts = False
 
         try:
-            # Create workbook
-            wb = excel_app.Workbooks.Add()
-
-            # Add VBA components
-            vb_project = wb.VBProject
-
-            # Add standard module
-            std_module = vb_project.VBComponents.Add(1)  # 1 = vbext_ct_StdModule
-            std_module.Name = "TestModule"
+            # Skip redraws, events and recalculation while the workbook is built
+            setup_settings = {"ScreenUpdating": excel_app.ScreenUpdating, "EnableEvents": excel_app.EnableEvents}
+            excel_app.ScreenUpdating = False
+            excel_app.EnableEvents = False
 
-            # Add class module
-            class_module = vb_project.VBComponents.Add(2)  # 2 = vbext_ct_ClassModule
-            class_module.Name = "TestClass"
-
-            # Add UserForm
-            userform = vb_project.VBComponents.Add(3)  # 3 = vbext_ct_MSForm
-            userform.Name = "TestForm"
-
-            # Save as macro-enabled workbook
-            wb.SaveAs(str(wb_path), FileFormat=52)  # 52 = xlOpenXMLWorkbookMacroEnabled
+            try:
+                # Create workbook
+                wb = excel_app.Workbooks.Add()
+
+                # Calculation can only be changed while a workbook is open
+                setup_settings["Calculation"] = excel_app.Calculation
+                excel_app.Calculation = -4135  # xlCalculationManual
+
+                # Add VBA components
+                vb_project = wb.VBProject
+
+                # Add standard module
+                std_module = vb_project.VBComponents.Add(1)  # 1 = vbext_ct_StdModule
+                std_module.Name = "TestModule"
+
+                # Add class module
+                class_module = vb_project.VBComponents.Add(2)  # 2 = vbext_ct_ClassModule
+                class_module.Name = "TestClass"
+
+                # Add UserForm
+                userform = vb_project.VBComponents.Add(3)  # 3 = vbext_ct_MSForm
+                userform.Name = "TestForm"
+
+                # Save as macro-enabled workbook
+                wb.SaveAs(str(wb_path), FileFormat=52)  # 52 = xlOpenXMLWorkbookMacroEnabled
+            finally:
+                # Restore before the test runs, so the CLI sees Excel's normal settings
+                for setting, value in setup_settings.items():
+                    try:
+                        setattr(excel_app, setting, value)
+                    except Exception:
+                        pass
 
             yield wb, wb_path
 
@@ -103,425 +610,6 @@ class TestExcelDataFidelity:
             except Exception:
                 pass
 
-    def generate_test_code_standard_module(self) -> str:
-        """Generate 150+ line test code for standard module."""
-        lines = [
-            'Attribute VB_Name = "TestModule"',
-            "Option Explicit",
-            "",
-            "' Test module with 150+ lines for data fidelity testing",
-            "' Contains special characters: äöüÄÖÜß € £ ¥",
-            '\' Contains quotes: ""double"" and apostrophes',
-            "",
-            'Public Const APP_NAME As String = "Test Application"',
-            'Public Const APP_VERSION As String = "1.0.0"',
-            "Public Const MAX_ITEMS As Long = 1000",
-            "",
-            "Private m_counter As Long",
-            "Private m_lastError As String",
-            "",
-            "' Initialize module",
-            "Public Sub Initialize()",
-            "    m_counter = 0",
-            '    m_lastError = ""',
-            '    Debug.Print "Module initialized at " & Now()',
-            "End Sub",
-            "",
-            "' Main processing function",
-            "Public Function ProcessData(ByVal input As String) As Boolean",
-            "    On Error GoTo ErrorHandler",
-            "    ",
-            "    Dim result As String",
-            "    Dim i As Long",
-            "    ",
-            "    ' Validate input",
-            "    If Len(input) = 0 Then",
-            '        m_lastError = "Input cannot be empty"',
-            "        ProcessData = False",
-            "        Exit Function",
-            "    End If",
-            "    ",
-            "    ' Process each character",
-            "    For i = 1 To Len(input)",
-            "        result = result & Mid(input, i, 1)",
-            "        m_counter = m_counter + 1",
-            "    Next i",
-            "    ",
-            "    ProcessData = True",
-            "    Exit Function",
-            "    ",
-            "ErrorHandler:",
-            '    m_lastError = "Error: " & Err.Description',
-            "    ProcessData = False",
-            "End Function",
-            "",
-            "' Calculate sum of array",
-            "Public Function CalculateSum(ByRef values() As Double) As Double",
-            "    Dim total As Double",
-            "    Dim i As Long",
-            "    ",
-            "    total = 0",
-            "    For i = LBound(values) To UBound(values)",
-            "        total = total + values(i)",
-            "    Next i",
-            "    ",
-            "    CalculateSum = total",
-            "End Function",
-            "",
-            "' Format currency with special characters",
-            "Public Function FormatCurrency(ByVal amount As Double, ByVal currency As String) As String",
-            "    Select Case currency",
-            '        Case "EUR"',
-            '            FormatCurrency = Format(amount, "#,##0.00") & " €"',
-            '        Case "GBP"',
-            '            FormatCurrency = "£" & Format(amount, "#,##0.00")',
-            '        Case "JPY"',
-            '            FormatCurrency = "¥" & Format(amount, "#,##0")',
-            "        Case Else",
-            '            FormatCurrency = Format(amount, "#,##0.00")',
-            "    End Select",
-            "End Function",
-            "",
-            "' Test German umlauts",
-            "Public Sub TestGermanCharacters()",
-            "    Dim text As String",
-            '    text = "Größe: groß, Maße: messen, Äpfel: Äpfel"',
-            '    text = text & vbCrLf & "Übung macht den Meister"',
-            '    text = text & vbCrLf & "Ökologie und Ökonomie"',
-            "    Debug.Print text",
-            "End Sub",
-            "",
-            "' Validate email address",
-            "Public Function IsValidEmail(ByVal email As String) As Boolean",
-            "    Dim atPos As Long",
-            "    Dim dotPos As Long",
-            "    ",
-            '    atPos = InStr(email, "@")',
-            "    If atPos = 0 Then",
-            "        IsValidEmail = False",
-            "        Exit Function",
-            "    End If",
-            "    ",
-            '    dotPos = InStrRev(email, ".")',
-            "    If dotPos = 0 Or dotPos < atPos Then",
-            "        IsValidEmail = False",
-            "        Exit Function",
-            "    End If",
-            "    ",
-            "    IsValidEmail = True",
-            "End Function",
-            "",
-            "' Get weekday name in German",
-            "Public Function GetWeekdayNameDE(ByVal weekday As Long) As String",
-            "    Select Case weekday",
-            '        Case 1: GetWeekdayNameDE = "Sonntag"',
-            '        Case 2: GetWeekdayNameDE = "Montag"',
-            '        Case 3: GetWeekdayNameDE = "Dienstag"',
-            '        Case 4: GetWeekdayNameDE = "Mittwoch"',
-            '        Case 5: GetWeekdayNameDE = "Donnerstag"',
-            '        Case 6: GetWeekdayNameDE = "Freitag"',
-            '        Case 7: GetWeekdayNameDE = "Samstag"',
-            '        Case Else: GetWeekdayNameDE = "Ungültig"',
-            "    End Select",
-            "End Function",
-            "",
-            "' Complex calculation with error handling",
-            "Public Function ComplexCalculation(ByVal x As Double, ByVal y As Double) As Double",
-            "    On Error GoTo ErrorHandler",
-            "    ",
-            "    Dim result As Double",
-            "    Dim temp As Double",
-            "    ",
-            "    ' Step 1: Validate inputs",
-            "    If x = 0 Then",
-            '        Err.Raise vbObjectError + 1000, , "X cannot be zero"',
-            "    End If",
-            "    ",
-            "    ' Step 2: Calculate intermediate value",
-            "    temp = (x * x + y * y) / x",
-            "    ",
-            "    ' Step 3: Apply formula",
-            "    result = temp * 3.14159265358979",
-            "    ",
-            "    ' Step 4: Return result",
-            "    ComplexCalculation = result",
-            "    Exit Function",
-            "    ",
-            "ErrorHandler:",
-            '    Debug.Print "Error in ComplexCalculation: " & Err.Description',
-            "    ComplexCalculation = 0",
-            "End Function",
-            "",
-            "' Generate report with special formatting",
-            "Public Sub GenerateReport()",
-            "    Dim report As String",
-            "    Dim i As Long",
-            "    ",
-            '    report = "╔═══════════════════════════════════╗" & vbCrLf',
-            '    report = report & "║     MONTHLY REPORT - " & Format(Now, "MMM YYYY") & "    ║" & vbCrLf',
-            '    report = report & "╠═══════════════════════════════════╣" & vbCrLf',
-            "    ",
-            "    For i = 1 To 10",
-            '        report = report & "║ Item " & i & ": € " & Format(i * 100, "#,##0.00") & Space(20 - Len(CStr(i))) & "║" & vbCrLf',
-            "    Next i",
-            "    ",
-            '    report = report & "╚═══════════════════════════════════╝"',
-            "    ",
-            "    Debug.Print report",
-            "End Sub",
-            "",
-            "' Test line endings and whitespace",
-            "Public Sub TestWhitespace()",
-            "    Dim text As String",
-            "    ",
-            "    ' Line with trailing spaces",
-            '    text = "Line 1    "',
-            "    ",
-            "    ' Line with tab character",
-            '    text = text & vbTab & "Tabbed text" & vbTab',
-            "    ",
-            "    ' Line with mixed spaces and tabs",
-            '    text = text & "  " & vbTab & "  Mixed"',
-            "    ",
-            "    Debug.Print text",
-            "End Sub",
-            "",
-            "' Last function - important for testing end of file",
-            "Public Function GetLastLine() As String",
-            '    GetLastLine = "This is the last line of the module"',
-            "End Function",
-        ]
-
-        return "\n".join(lines)
-
-    def generate_test_code_class_module(self) -> str:
-        """Generate 150+ line test code for class module.
-
-        Note: Does NOT include VBA headers (VERSION, BEGIN, END, Attribute lines).
-        These are automatically managed by VBA when using AddFromString().
-        """
-        lines = [
-            "Option Explicit",
-            "",
-            "' Class module for testing data fidelity",
-            "' Tests property procedures, private members, and class behavior",
-            "",
-            "' Private member variables",
-            "Private m_name As String",
-            "Private m_value As Double",
-            "Private m_isActive As Boolean",
-            "Private m_created As Date",
-            "Private m_description As String",
-            "Private m_tags As Collection",
-            "",
-            "' Constants",
-            'Private Const DEFAULT_NAME As String = "Unnamed"',
-            "Private Const MAX_VALUE As Double = 999999.99",
-            "Private Const MIN_VALUE As Double = -999999.99",
-            "",
-            "' Class initialization",
-            "Private Sub Class_Initialize()",
-            "    m_name = DEFAULT_NAME",
-            "    m_value = 0",
-            "    m_isActive = True",
-            "    m_created = Now()",
-            '    m_description = ""',
-            "    Set m_tags = New Collection",
-            "    ",
-            '    Debug.Print "TestClass instance created at " & m_created',
-            "End Sub",
-            "",
-            "' Class termination",
-            "Private Sub Class_Terminate()",
-            "    Set m_tags = Nothing",
-            '    Debug.Print "TestClass instance destroyed"',
-            "End Sub",
-            "",
-            "' Name property - Get",
-            "Public Property Get Name() As String",
-            "    Name = m_name",
-            "End Property",
-            "",
-            "' Name property - Let",
-            "Public Property Let Name(ByVal newName As String)",
-            "    If Len(newName) = 0 Then",
-            '        Err.Raise vbObjectError + 1001, "TestClass", "Name cannot be empty"',
-            "    End If",
-            "    ",
-            "    m_name = newName",
-            "End Property",
-            "",
-            "' Value property - Get",
-            "Public Property Get Value() As Double",
-            "    Value = m_value",
-            "End Property",
-            "",
-            "' Value property - Let with validation",
-            "Public Property Let Value(ByVal newValue As Double)",
-            "    If newValue < MIN_VALUE Then",
-            '        Err.Raise vbObjectError + 1002, "TestClass", "Value too small"',
-            "    End If",
-            "    ",
-            "    If newValue > MAX_VALUE Then",
-            '        Err.Raise vbObjectError + 1003, "TestClass", "Value too large"',
-            "    End If",
-            "    ",
-            "    m_value = newValue",
-            "End Property",
-            "",
-            "' IsActive property - Get",
-            "Public Property Get IsActive() As Boolean",
-            "    IsActive = m_isActive",
-            "End Property",
-            "",
-            "' IsActive property - Let",
-            "Public Property Let IsActive(ByVal newStatus As Boolean)",
-            "    m_isActive = newStatus",
-            "    ",
-            "    If m_isActive Then",
-            '        Debug.Print m_name & " activated"',
-            "    Else",
-            '        Debug.Print m_name & " deactivated"',
-            "    End If",
-            "End Property",
-            "",
-            "' Created property - Get (read-only)",
-            "Public Property Get Created() As Date",
-            "    Created = m_created",
-            "End Property",
-            "",
-            "' Description property - Get",
-            "Public Property Get Description() As String",
-            "    Description = m_description",
-            "End Property",
-            "",
-            "' Description property - Let",
-            "Public Property Let Description(ByVal newDescription As String)",
-            "    m_description = newDescription",
-            "End Property",
-            "",
-            "' Add tag to collection",
-            "Public Sub AddTag(ByVal tag As String)",
-            "    On Error Resume Next",
-            "    m_tags.Add tag, tag  ' Key is tag itself for uniqueness",
-            "    ",
-            "    If Err.Number = 0 Then",
-            '        Debug.Print "Tag added: " & tag',
-            "    Else",
-            '        Debug.Print "Tag already exists: " & tag',
-            "    End If",
-            "    ",
-            "    On Error GoTo 0",
-            "End Sub",
-            "",
-            "' Remove tag from collection",
-            "Public Sub RemoveTag(ByVal tag As String)",
-            "    On Error Resume Next",
-            "    m_tags.Remove tag",
-            "    ",
-            "    If Err.Number = 0 Then",
-            '        Debug.Print "Tag removed: " & tag',
-            "    Else",
-            '        Debug.Print "Tag not found: " & tag',
-            "    End If",
-            "    ",
-            "    On Error GoTo 0",
-            "End Sub",
-            "",
-            "' Check if tag exists",
-            "Public Function HasTag(ByVal tag As String) As Boolean",
-            "    Dim item As Variant",
-            "    ",
-            "    On Error Resume Next",
-            "    item = m_tags(tag)",
-            "    HasTag = (Err.Number = 0)",
-            "    On Error GoTo 0",
-            "End Function",
-            "",
-            "' Get all tags as array",
-            "Public Function GetTags() As String()",
-            "    Dim tags() As String",
-            "    Dim i As Long",
-            "    Dim item As Variant",
-            "    ",
-            "    If m_tags.Count = 0 Then",
-            '        GetTags = Split("", ",")  \' Empty array',
-            "        Exit Function",
-            "    End If",
-            "    ",
-            "    ReDim tags(1 To m_tags.Count)",
-            "    ",
-            "    i = 1",
-            "    For Each item In m_tags",
-            "        tags(i) = CStr(item)",
-            "        i = i + 1",
-            "    Next item",
-            "    ",
-            "    GetTags = tags",
-            "End Function",
-            "",
-            "' Validate object state",
-            "Public Function Validate() As Boolean",
-            "    Dim isValid As Boolean",
-            "    ",
-            "    isValid = True",
-            "    ",
-            "    ' Check name",
-            "    If Len(m_name) = 0 Then",
-            '        Debug.Print "Validation error: Name is empty"',
-            "        isValid = False",
-            "    End If",
-            "    ",
-            "    ' Check value range",
-            "    If m_value < MIN_VALUE Or m_value > MAX_VALUE Then",
-            '        Debug.Print "Validation error: Value out of range"',
-            "        isValid = False",
-            "    End If",
-            "    ",
-            "    Validate = isValid",
-            "End Function",
-            "",
-            "' Clone this object",
-            "Public Function Clone() As TestClass",
-            "    Dim newObj As New TestClass",
-            "    ",
-            "    newObj.Name = m_name",
-            "    newObj.Value = m_value",
-            "    newObj.IsActive = m_isActive",
-            "    newObj.Description = m_description",
-            "    ",
-            "    ' Copy tags",
-            "    Dim tag As Variant",
-            "    For Each tag In m_tags",
-            "        newObj.AddTag CStr(tag)",
-            "    Next tag",
-            "    ",
-            "    Set Clone = newObj",
-            "End Function",
-            "",
-            "' Export to formatted string",
-            "Public Function ToString() As String",
-            "    Dim result As String",
-            "    ",
-            '    result = "TestClass Object" & vbCrLf',
-            '    result = result & "  Name: " & m_name & vbCrLf',
-            '    result = result & "  Value: " & Format(m_value, "#,##0.00") & vbCrLf',
-            '    result = result & "  Active: " & m_isActive & vbCrLf',
-            '    result = result & "  Created: " & Format(m_created, "yyyy-mm-dd hh:nn:ss") & vbCrLf',
-            '    result = result & "  Tags: " & m_tags.Count',
-            "    ",
-            "    ToString = result",
-            "End Function",
-            "",
-            "' Final method - tests end of class",
-            "Public Sub Finalize()",
-            '    Debug.Print "Finalizing " & m_name',
-            "    m_isActive = False",
-            "End Sub",
-        ]
-
-        return "\n".join(lines)
-
     def extract_code_lines(self, full_content: str) -> List[str]:
         """Extract code lines, skipping attribute headers.
 
@@ -530,144 +618,85 @@ class TestExcelDataFidelity:
         Normalizes line endings (removes \r) for consistent comparison.
         Strips trailing empty lines.
         """
-        # Normalize line endings: VBA Editor returns lines with \r, files don't
-        normalized = full_content.replace("\r\n", "\n").replace("\r", "\n")
-        lines = normalized.split("\n")
-
-        # Find where actual code starts (after headers)
-        code_start = 0
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            # Skip header lines
-            if (
-                stripped.startswith(
-                    (
-                        "VERSION",
-                        "BEGIN",
-                        "END",
-                        "Attribute VB_Name",
-                        "Attribute VB_GlobalNameSpace",
-                        "Attribute VB_Creatable",
-                        "Attribute VB_PredeclaredId",
-                        "Attribute VB_Exposed",
-                    )
-                )
-                or stripped == "MultiUse = -1  'True"
-                or (stripped.startswith("Attribute") and "VB_Name" not in stripped)
-            ):
-                continue
-            else:
-                # Found first non-header line
-                code_start = i
-                break
-
-        code_lines = lines[code_start:]
+        # Split on any line ending: VBA Editor returns lines with \r, files don't
+        lines = full_content.splitlines()
 
         # Strip trailing empty lines (common in text files)
-        while code_lines and code_lines[-1] == "":
-            code_lines.pop()
-
-        return code_lines
-
-    @pytest.mark.integration
-    @pytest.mark.com
-    @pytest.mark.office
-    @pytest.mark.excel
-    def test_export_standard_module_line_by_line(self, test_workbook, tmp_path):
-        """Test that exported standard module code matches VBE exactly, line by line."""
-        wb, wb_path = test_workbook
-        vba_dir = tmp_path / "vba"
-
-        # Generate and load test code (150+ lines)
-        test_code = self.generate_test_code_standard_module()
+        end = len(lines)
+        while end > 0 and not lines[end - 1]:
+            end -= 1
 
-        # Set code in VBA Editor
-        vb_project = wb.VBProject
-        test_module = vb_project.VBComponents("TestModule")
-        code_module = test_module.CodeModule
-        code_module.AddFromString(test_code)
+        # Code starts at the first non-header line
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if not (stripped.startswith(_HEADER_PREFIXES) or stripped == "MultiUse = -1  'True"):
+                return lines[i:end]
 
-        # Get code from VBA Editor
-        vbe_code = code_module.Lines(1, code_module.CountOfLines)
-        vbe_lines = self.extract_code_lines(vbe_code)
+        return lines[:end]
 
-        # Verify we have 150+ lines
-        assert len(vbe_lines) >= 150, f"Test code should have 150+ lines, got {len(vbe_lines)}"
+    def log_components(self, vb_project, when: str) -> None:
+        """Log name and type of each VBA component at debug level.
 
-        # Export using CLI
-        cli = CLITester("excel-vba")
-        cli.assert_success(
-            [
-                "export",
-                "-f",
-                str(wb_path),
-                "--vba-directory",
-                str(vba_dir),
-                "--force-overwrite",
-                "--save-headers",  # Use separate header files (proven approach)
-            ]
+        Reading them costs two COM calls per component, so they are only read when debug logging is on.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        components = [(comp.Name, comp.Type) for comp in vb_project.VBComponents]
+        logger.debug(
+            "Components %s import (%d):\n%s",
+            when,
+            len(components),
+            "\n".join(f"  {i}. {name} (Type: {comp_type})" for i, (name, comp_type) in enumerate(components, 1)),
         )
 
-        # Read exported file
-        exported_file = vba_dir / "TestModule.bas"
-        assert exported_file.exists(), "TestModule.bas was not exported"
-
-        with open(exported_file, "r", encoding="cp1252") as f:
-            exported_content = f.read()
-
-        exported_lines = self.extract_code_lines(exported_content)
-
-        # Test 1: Line count must match
-        assert len(exported_lines) == len(vbe_lines), (
-            f"Line count mismatch: VBE={len(vbe_lines)}, Exported={len(exported_lines)}"
+    def assert_sample_lines_match(self, file_lines: List[str], vbe_lines: List[str], label: str) -> None:
+        """Assert that VBE code matches the file in line count and in its first, middle and last 3 lines."""
+        assert len(vbe_lines) == len(file_lines), (
+            f"{label} line count mismatch: Expected={len(file_lines)}, Got={len(vbe_lines)}"
         )
 
-        # Test 2: First 3 lines must match exactly
-        for i in range(min(3, len(vbe_lines))):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
+        count = len(file_lines)
+        mid_start = count // 2
+        for window in (slice(0, 3), slice(mid_start, mid_start + 3), slice(max(0, count - 3), count)):
+            assert vbe_lines[window] == file_lines[window], (
+                f"{label} lines {window.start + 1}-{min(window.stop, count)} mismatch:\n"
+                f"  File: {file_lines[window]}\n  VBE: {vbe_lines[window]}"
             )
 
-        # Test 3: Middle 3 lines must match exactly
-        mid_start = len(vbe_lines) // 2
-        for i in range(mid_start, min(mid_start + 3, len(vbe_lines))):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
-            )
-
-        # Test 4: Last 3 lines must match exactly
-        for i in range(max(0, len(vbe_lines) - 3), len(vbe_lines)):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
-            )
+    def test_test_code_has_150_plus_lines(self):
+        """Test that the generated module code is long enough for the line-by-line tests."""
+        for name, test_code in [("standard", _STANDARD_MODULE_CODE), ("class", _CLASS_MODULE_CODE)]:
+            code_lines = self.extract_code_lines(test_code)
+            assert len(code_lines) >= 150, f"{name} module test code should have 150+ lines, got {len(code_lines)}"
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_export_class_module_line_by_line(self, test_workbook, tmp_path):
-        """Test that exported class module code matches VBE exactly, line by line."""
+    def test_export_modules_line_by_line(self, test_workbook, cli, tmp_path):
+        """Test that exported standard and class module code matches VBE exactly, line by line.
+
+        Both modules are loaded first so a single CLI export covers them.
+        """
         wb, wb_path = test_workbook
         vba_dir = tmp_path / "vba"
 
-        # Generate and load test code (150+ lines)
-        test_code = self.generate_test_code_class_module()
+        # (component name, exported file, test code (150+ lines))
+        components = [
+            ("TestModule", "TestModule.bas", _STANDARD_MODULE_CODE),
+            ("TestClass", "TestClass.cls", _CLASS_MODULE_CODE),
+        ]
 
-        # Set code in VBA Editor
+        # Set code in VBA Editor and remember what VBE holds
         vb_project = wb.VBProject
-        test_class = vb_project.VBComponents("TestClass")
-        code_module = test_class.CodeModule
-        code_module.AddFromString(test_code)
-
-        # Get code from VBA Editor
-        vbe_code = code_module.Lines(1, code_module.CountOfLines)
-        vbe_lines = self.extract_code_lines(vbe_code)
-
-        # Verify we have 150+ lines
-        assert len(vbe_lines) >= 150, f"Test code should have 150+ lines, got {len(vbe_lines)}"
+        vbe_lines_by_name = {}
+        for name, _, test_code in components:
+            code_module = vb_project.VBComponents(name).CodeModule
+            code_module.AddFromString(test_code)
+            vbe_code = code_module.Lines(1, code_module.CountOfLines)
+            vbe_lines_by_name[name] = self.extract_code_lines(vbe_code)
 
         # Export using CLI
-        cli = CLITester("excel-vba")
         cli.assert_success(
             [
                 "export",
@@ -680,102 +709,27 @@ class TestExcelDataFidelity:
             ]
         )
 
-        # Read exported file
-        exported_file = vba_dir / "TestClass.cls"
-        assert exported_file.exists(), "TestClass.cls was not exported"
+        for name, file_name, _ in components:
+            vbe_lines = vbe_lines_by_name[name]
 
-        with open(exported_file, "r", encoding="cp1252") as f:
-            exported_content = f.read()
+            # Read exported file
+            exported_file = vba_dir / file_name
+            assert exported_file.exists(), f"{file_name} was not exported"
 
-        exported_lines = self.extract_code_lines(exported_content)
+            exported_content = exported_file.read_text(encoding="cp1252")
 
-        # Test line-by-line matching (same as standard module tests)
-        assert len(exported_lines) == len(vbe_lines), (
-            f"Line count mismatch: VBE={len(vbe_lines)}, Exported={len(exported_lines)}"
-        )
+            exported_lines = self.extract_code_lines(exported_content)
 
-        # First 3 lines
-        for i in range(min(3, len(vbe_lines))):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
-            )
-
-        # Middle 3 lines
-        mid_start = len(vbe_lines) // 2
-        for i in range(mid_start, min(mid_start + 3, len(vbe_lines))):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
-            )
-
-        # Last 3 lines
-        for i in range(max(0, len(vbe_lines) - 3), len(vbe_lines)):
-            assert exported_lines[i] == vbe_lines[i], (
-                f"Line {i + 1} mismatch:\n  VBE: '{vbe_lines[i]}'\n  File: '{exported_lines[i]}'"
-            )
-
-    def generate_test_code_thisworkbook(self) -> str:
-        """Generate test code for ThisWorkbook document module."""
-        lines = [
-            "Option Explicit",
-            "",
-            "' ThisWorkbook module - Document-level code",
-            "' This must be imported to the ThisWorkbook document module, not as a separate module",
-            "",
-            "Private Sub Workbook_Open()",
-            '    MsgBox "Workbook opened at " & Now(), vbInformation',
-            '    Debug.Print "Workbook_Open event fired"',
-            "End Sub",
-            "",
-            "Private Sub Workbook_BeforeClose(Cancel As Boolean)",
-            "    Dim response As VbMsgBoxResult",
-            "    ",
-            '    response = MsgBox("Save changes before closing?", vbYesNoCancel)',
-            "    ",
-            "    Select Case response",
-            "        Case vbYes",
-            "            ThisWorkbook.Save",
-            "        Case vbCancel",
-            "            Cancel = True",
-            "    End Select",
-            "End Sub",
-            "",
-            "Private Sub Workbook_BeforeSave(ByVal SaveAsUI As Boolean, Cancel As Boolean)",
-            '    Debug.Print "Saving workbook at " & Now()',
-            "End Sub",
-            "",
-            "Public Function GetWorkbookInfo() As String",
-            "    Dim info As String",
-            "    ",
-            '    info = "Workbook: " & ThisWorkbook.Name & vbCrLf',
-            '    info = info & "Path: " & ThisWorkbook.Path & vbCrLf',
-            '    info = info & "Sheets: " & ThisWorkbook.Worksheets.Count & vbCrLf',
-            '    info = info & "Created: " & ThisWorkbook.BuiltinDocumentProperties("Creation Date")',
-            "    ",
-            "    GetWorkbookInfo = info",
-            "End Function",
-            "",
-            "Public Sub RefreshAllData()",
-            "    Dim ws As Worksheet",
-            "    ",
-            "    Application.ScreenUpdating = False",
-            "    ",
-            "    For Each ws In ThisWorkbook.Worksheets",
-            "        ws.Calculate",
-            "    Next ws",
-            "    ",
-            "    Application.ScreenUpdating = True",
-            "    ",
-            '    MsgBox "All data refreshed", vbInformation',
-            "End Sub",
-        ]
-
-        return "\n".join(lines)
+            # Every line must match exactly
+            if exported_lines != vbe_lines:
+                diff = difflib.unified_diff(vbe_lines, exported_lines, "VBE", file_name, lineterm="")
+                pytest.fail(f"{name} export differs from VBE:\n" + "\n".join(diff))
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_import_thisworkbook_to_correct_location(self, test_workbook, tmp_path):
+    def test_import_thisworkbook_to_correct_location(self, test_workbook, cli, tmp_path):
         """Test that ThisWorkbook code is imported to document module, not as standalone module.
 
         This is critical: ThisWorkbook.cls must be imported into the existing
@@ -787,7 +741,7 @@ class TestExcelDataFidelity:
         vba_dir = tmp_path / "vba"
 
         # Generate test code for ThisWorkbook
-        test_code = self.generate_test_code_thisworkbook()
+        test_code = _THISWORKBOOK_CODE
 
         vb_project = wb.VBProject
 
@@ -802,7 +756,6 @@ class TestExcelDataFidelity:
         code_module.AddFromString(test_code)
 
         # Export using --save-headers (separate header files - the proven approach)
-        cli = CLITester("excel-vba")
         cli.assert_success(
             [
                 "export",
@@ -820,8 +773,7 @@ class TestExcelDataFidelity:
         exported_file = vba_dir / f"{thisworkbook_name}.cls"
         assert exported_file.exists(), f"{thisworkbook_name}.cls was not exported"
 
-        with open(exported_file, "r", encoding="cp1252") as f:
-            exported_content = f.read()
+        exported_content = exported_file.read_text(encoding="cp1252")
         exported_lines = self.extract_code_lines(exported_content)
 
         # Clear ThisWorkbook code
@@ -848,11 +800,7 @@ class TestExcelDataFidelity:
         components_before = vb_project.VBComponents.Count
 
         # Debug: List components before import
-        print(f"\n=== Components BEFORE import ({components_before}) ===")
-        for i in range(1, components_before + 1):
-            comp = vb_project.VBComponents(i)
-            print(f"  {i}. {comp.Name} (Type: {comp.Type})")
-        print("=" * 50)
+        self.log_components(vb_project, "before")
 
         # Import
         cli.assert_success(["import", "-f", str(wb_path), "--vba-directory", str(vba_dir)])
@@ -861,11 +809,7 @@ class TestExcelDataFidelity:
         components_after = vb_project.VBComponents.Count
 
         # Debug: List components after import
-        print(f"\n=== Components AFTER import ({components_after}) ===")
-        for i in range(1, components_after + 1):
-            comp = vb_project.VBComponents(i)
-            print(f"  {i}. {comp.Name} (Type: {comp.Type})")
-        print("=" * 50)
+        self.log_components(vb_project, "after")
 
         # Verify no new component was added (ThisWorkbook should still be document module)
         assert components_after == components_before, (
@@ -884,117 +828,31 @@ class TestExcelDataFidelity:
         imported_code = code_module.Lines(1, code_module.CountOfLines)
         imported_lines = self.extract_code_lines(imported_code)
 
-        # Verify line count
-        assert len(imported_lines) == len(exported_lines), (
-            f"ThisWorkbook import line count mismatch: Expected={len(exported_lines)}, Got={len(imported_lines)}"
-        )
-
-        # Verify first 3 lines
-        for i in range(min(3, len(exported_lines))):
-            assert imported_lines[i] == exported_lines[i], (
-                f"ThisWorkbook line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
-
-        # Verify last 3 lines
-        for i in range(max(0, len(exported_lines) - 3), len(exported_lines)):
-            assert imported_lines[i] == exported_lines[i], (
-                f"ThisWorkbook line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
+        # Verify line count and first, middle and last lines
+        self.assert_sample_lines_match(exported_lines, imported_lines, "ThisWorkbook")
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_import_standard_module_line_by_line(self, test_workbook, tmp_path):
-        """Test that imported standard module code matches exported file exactly."""
-        wb, wb_path = test_workbook
-        vba_dir = tmp_path / "vba"
-
-        # Generate and export test code
-        test_code = self.generate_test_code_standard_module()
+    def test_roundtrip_preserves_code_exactly(self, test_workbook, cli, tmp_path):
+        """Test that export → import → export produces identical code.
 
-        vb_project = wb.VBProject
-        test_module = vb_project.VBComponents("TestModule")
-        code_module = test_module.CodeModule
-        code_module.AddFromString(test_code)
-
-        # Export
-        cli = CLITester("excel-vba")
-        cli.assert_success(
-            [
-                "export",
-                "-f",
-                str(wb_path),
-                "--vba-directory",
-                str(vba_dir),
-                "--force-overwrite",
-                "--save-headers",  # Use separate header files (proven approach)
-                "--keep-open",  # Keep document open for subsequent operations
-            ]
-        )
-
-        # Read exported file
-        exported_file = vba_dir / "TestModule.bas"
-        with open(exported_file, "r", encoding="cp1252") as f:
-            exported_content = f.read()
-        exported_lines = self.extract_code_lines(exported_content)
-
-        # Delete module from VBA project
-        vb_project.VBComponents.Remove(test_module)
-
-        # Import
-        cli.assert_success(["import", "-f", str(wb_path), "--vba-directory", str(vba_dir)])
-
-        # Get imported code from VBA Editor
-        test_module = vb_project.VBComponents("TestModule")
-        code_module = test_module.CodeModule
-        imported_code = code_module.Lines(1, code_module.CountOfLines)
-        imported_lines = self.extract_code_lines(imported_code)
-
-        # Verify line-by-line match
-        assert len(imported_lines) == len(exported_lines), (
-            f"Line count mismatch after import: Expected={len(exported_lines)}, Got={len(imported_lines)}"
-        )
-
-        # First 3 lines
-        for i in range(min(3, len(exported_lines))):
-            assert imported_lines[i] == exported_lines[i], (
-                f"Import line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
-
-        # Middle 3 lines
-        mid_start = len(exported_lines) // 2
-        for i in range(mid_start, min(mid_start + 3, len(exported_lines))):
-            assert imported_lines[i] == exported_lines[i], (
-                f"Import line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
-
-        # Last 3 lines
-        for i in range(max(0, len(exported_lines) - 3), len(exported_lines)):
-            assert imported_lines[i] == exported_lines[i], (
-                f"Import line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
-
-    @pytest.mark.integration
-    @pytest.mark.com
-    @pytest.mark.office
-    @pytest.mark.excel
-    def test_roundtrip_preserves_code_exactly(self, test_workbook, tmp_path):
-        """Test that export → import → export produces identical code."""
+        Also checks that the imported standard module matches the exported file
+        line by line, so the first export and import serve both checks.
+        """
         wb, wb_path = test_workbook
         vba_dir1 = tmp_path / "vba1"
         vba_dir2 = tmp_path / "vba2"
 
         # Generate test code
-        test_code = self.generate_test_code_standard_module()
+        test_code = _STANDARD_MODULE_CODE
 
         vb_project = wb.VBProject
         test_module = vb_project.VBComponents("TestModule")
         code_module = test_module.CodeModule
         code_module.AddFromString(test_code)
 
-        cli = CLITester("excel-vba")
-
         # First export
         cli.assert_success(
             [
@@ -1010,8 +868,7 @@ class TestExcelDataFidelity:
         )
 
         # Read first export
-        with open(vba_dir1 / "TestModule.bas", "r", encoding="cp1252") as f:
-            export1_content = f.read()
+        export1_content = (vba_dir1 / "TestModule.bas").read_text(encoding="cp1252")
         export1_lines = self.extract_code_lines(export1_content)
 
         # Delete and import
@@ -1019,6 +876,15 @@ class TestExcelDataFidelity:
 
         cli.assert_success(["import", "-f", str(wb_path), "--vba-directory", str(vba_dir1)])
 
+        # Get imported code from VBA Editor
+        test_module = vb_project.VBComponents("TestModule")
+        code_module = test_module.CodeModule
+        imported_code = code_module.Lines(1, code_module.CountOfLines)
+        imported_lines = self.extract_code_lines(imported_code)
+
+        # Verify the imported module matches the exported file line by line
+        self.assert_sample_lines_match(export1_lines, imported_lines, "Import")
+
         # Second export
         cli.assert_success(
             [
@@ -1034,21 +900,21 @@ class TestExcelDataFidelity:
         )
 
         # Read second export
-        with open(vba_dir2 / "TestModule.bas", "r", encoding="cp1252") as f:
-            export2_content = f.read()
-        export2_lines = self.extract_code_lines(export2_content)
+        export2_content = (vba_dir2 / "TestModule.bas").read_text(encoding="cp1252")
 
-        # Verify both exports are identical
-        assert len(export1_lines) == len(export2_lines), "Round-trip changed line count"
+        # Verify both exports are identical - only compare code lines if the files differ at all
+        if export2_content != export1_content:
+            export2_lines = self.extract_code_lines(export2_content)
+            assert len(export1_lines) == len(export2_lines), "Round-trip changed line count"
 
-        for i, (line1, line2) in enumerate(zip(export1_lines, export2_lines)):
-            assert line1 == line2, f"Round-trip changed line {i + 1}:\n  First: '{line1}'\n  Second: '{line2}'"
+            for i, (line1, line2) in enumerate(zip(export1_lines, export2_lines)):
+                assert line1 == line2, f"Round-trip changed line {i + 1}:\n  First: '{line1}'\n  Second: '{line2}'"
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_in_file_headers_document_module(self, test_workbook, tmp_path):
+    def test_in_file_headers_document_module(self, test_workbook, cli, tmp_path):
         """Test that --in-file-headers properly strips headers from document modules (ThisWorkbook).
 
         This test validates the fix for the bug where VERSION, BEGIN, END, MultiUse,
@@ -1075,32 +941,17 @@ End Sub
 """
 
         vb_project = wb.VBProject
-        # Get the ThisWorkbook document module
-        # In Excel, document modules have Type = 100 (vbext_ct_Document)
+        # Get the ThisWorkbook document module straight from the workbook's CodeName
         # Note: Name varies by Excel language (ThisWorkbook, DieseArbeitsmappe, CeClasseur, etc.)
-        doc_module = None
-        for component in vb_project.VBComponents:
-            if component.Type == 100:  # vbext_ct_Document
-                # Use VBADocumentNames to detect workbook module in any language
-                if (
-                    VBADocumentNames.is_document_module(component.Name)
-                    and component.Name in VBADocumentNames.EXCEL_WORKBOOK_NAMES
-                ):
-                    doc_module = component
-                    print(f"Found workbook document module: {component.Name}")
-                    break
-
-        assert doc_module is not None, (
-            f"Could not find ThisWorkbook/DieseArbeitsmappe/etc. module. VBComponents: {[c.Name for c in vb_project.VBComponents]}"
-        )
+        doc_module = vb_project.VBComponents(wb.CodeName)
+        # In Excel, document modules have Type = 100 (vbext_ct_Document)
+        assert doc_module.Type == 100, f"{doc_module.Name} is not a document module (type {doc_module.Type})"
 
         # Add test code to ThisWorkbook
         code_module = doc_module.CodeModule
         code_module.DeleteLines(1, code_module.CountOfLines)  # Clear existing
         code_module.AddFromString(test_code)
 
-        cli = CLITester("excel-vba")
-
         # Export with --in-file-headers (headers embedded in .cls file)
         cli.assert_success(
             [
@@ -1120,8 +971,7 @@ End Sub
         exported_file = vba_dir / f"{doc_module.Name}.cls"
         assert exported_file.exists(), f"{doc_module.Name}.cls was not exported. Files: {list(vba_dir.glob('*.cls'))}"
 
-        with open(exported_file, "r", encoding="cp1252") as f:
-            exported_content = f.read()
+        exported_content = exported_file.read_text(encoding="cp1252")
 
         # Verify headers are present in file
         assert "VERSION 1.0 CLASS" in exported_content, "VERSION header missing from exported file"
@@ -1152,33 +1002,19 @@ End Sub
         imported_lines = self.extract_code_lines(imported_code)
 
         # CRITICAL CHECK: Headers should NOT appear in imported code
-        for line in imported_lines:
-            assert not line.strip().startswith("VERSION"), f"VERSION header imported as code: '{line}'"
-            assert not line.strip().startswith("BEGIN"), f"BEGIN header imported as code: '{line}'"
-            assert not line.strip() == "END", f"END header imported as code: '{line}'"
-            assert not line.strip().startswith("MultiUse"), f"MultiUse header imported as code: '{line}'"
-            assert not (line.strip().startswith("Attribute VB_") and "=" in line), (
-                f"Attribute header imported as code: '{line}'"
-            )
-
-        # Verify code integrity - line count should match
-        assert len(imported_lines) == len(exported_lines), (
-            f"Line count mismatch: Expected={len(exported_lines)}, Got={len(imported_lines)}"
-        )
+        header_lines = [line for line in imported_lines if _HEADER_LINE_RE.match(line)]
+        assert not header_lines, f"Headers imported as code: {header_lines}"
 
-        # Verify first few lines match
-        for i in range(min(3, len(exported_lines))):
-            assert imported_lines[i] == exported_lines[i], (
-                f"Line {i + 1} mismatch:\n  File: '{exported_lines[i]}'\n  VBE: '{imported_lines[i]}'"
-            )
+        # Verify code integrity - line count and first, middle and last lines
+        self.assert_sample_lines_match(exported_lines, imported_lines, "Document module")
 
-        print("✅ SUCCESS: --in-file-headers correctly strips headers from document module!")
+        logger.info("✅ SUCCESS: --in-file-headers correctly strips headers from document module!")
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_issue16_hidden_member_attributes_filtered(self, test_workbook, tmp_path):
+    def test_issue16_hidden_member_attributes_filtered(self, test_workbook, cli, tmp_path):
         """Test that hidden member attributes are filtered during import (Issue #16).
 
         Issue #16: Hidden member attributes like 'Attribute MyCtrl.VB_VarHelpID = -1'
@@ -1213,7 +1049,7 @@ End Sub
 """
         test_class.CodeModule.AddFromString(test_code)
 
-        print(f"Added test code to TestClass ({len(test_code)} chars)")
+        logger.debug("Added test code to TestClass (%d chars)", len(test_code))
 
         # Get the code module
         code_module = test_class.CodeModule
@@ -1225,10 +1061,9 @@ End Sub
         assert temp_export.exists(), "Export failed"
 
         # Read the exported file
-        with open(temp_export, "r", encoding="cp1252") as f:
-            exported_content = f.read()
+        exported_content = temp_export.read_text(encoding="cp1252")
 
-        print(f"Exported content: {len(exported_content)} chars")
+        logger.debug("Exported content: %d chars", len(exported_content))
 
         # Manually inject hidden member attributes (simulating Issue #16 scenario)
         # These attributes should be MIXED INTO THE CODE, not in the header section
@@ -1265,14 +1100,13 @@ End Sub
         with open(temp_export, "w", encoding="cp1252") as f:
             f.write(modified_content)
 
-        print(f"Injected {len(hidden_attrs)} hidden member attributes")
+        logger.debug("Injected %d hidden member attributes", len(hidden_attrs))
 
         # Clear the module
         if code_module.CountOfLines > 0:
             code_module.DeleteLines(1, code_module.CountOfLines)
 
         # Now import just this ONE file using vba-edit - AUTO-DETECTION
-        cli = CLITester("excel-vba")
         cli.assert_success(["import", "-f", str(wb_path), "--vba-directory", str(vba_dir_isolated)])
 
         # Verify the code is back
@@ -1281,18 +1115,18 @@ End Sub
         line_count = code_module.CountOfLines
         imported_code = code_module.Lines(1, line_count) if line_count > 0 else ""
 
-        print(f"Imported code: {len(imported_code)} chars")
+        logger.debug("Imported code: %d chars", len(imported_code))
 
         # Check that code exists (not empty)
         assert len(imported_code.strip()) > 0, "Code was lost during import with hidden member attributes"
 
-        print("✅ SUCCESS: Issue #16 fixed - hidden member attributes filtered during import!")
+        logger.info("✅ SUCCESS: Issue #16 fixed - hidden member attributes filtered during import!")
 
     @pytest.mark.integration
     @pytest.mark.com
     @pytest.mark.office
     @pytest.mark.excel
-    def test_issue16_module_level_attributes_preserved(self, test_workbook, tmp_path):
+    def test_issue16_module_level_attributes_preserved(self, test_workbook, cli, tmp_path):
         """Test that module-level attributes are preserved (NOT filtered) - Issue #16.
 
         This validates that the Issue #16 fix correctly distinguishes between:
@@ -1307,7 +1141,7 @@ End Sub
 
         vb_project = wb.VBProject
 
-        print("Using existing TestModule for module-level attributes test...")
+        logger.debug("Using existing TestModule for module-level attributes test...")
 
         # Use the existing TestModule from the fixture
         test_module = vb_project.VBComponents("TestModule")
@@ -1325,7 +1159,7 @@ End Sub
 """
         test_module.CodeModule.AddFromString(test_code)
 
-        print(f"Added test code to TestModule ({len(test_code)} chars)")
+        logger.debug("Added test code to TestModule (%d chars)", len(test_code))
 
         # Get the code module
         code_module = test_module.CodeModule
@@ -1337,10 +1171,9 @@ End Sub
         assert temp_export.exists(), "Export failed"
 
         # Read the exported file
-        with open(temp_export, "r", encoding="cp1252") as f:
-            original_content = f.read()
+        original_content = temp_export.read_text(encoding="cp1252")
 
-        print(f"Exported content: {len(original_content)} chars")
+        logger.debug("Exported content: %d chars", len(original_content))
 
         # Verify module-level attributes are present
         assert "Attribute VB_Name" in original_content, "VB_Name attribute not found"
@@ -1382,7 +1215,7 @@ End Sub
         with open(temp_export, "w", encoding="cp1252") as f:
             f.write(modified_content)
 
-        print(f"Modified content includes {len(test_attrs)} test attributes")
+        logger.debug("Modified content includes %d test attributes", len(test_attrs))
 
         # Clear the module
         if code_module.CountOfLines > 0:
@@ -1390,8 +1223,7 @@ End Sub
 
         # Import - Issue #16 fix should filter hidden member attributes but preserve module-level
         # AUTO-DETECTION: Headers detected automatically
-        print("Importing module with mixed attribute types...")
-        cli = CLITester("excel-vba")
+        logger.debug("Importing module with mixed attribute types...")
         cli.assert_success(["import", "-f", str(wb_path), "--vba-directory", str(vba_dir_isolated)])
 
         # Verify the code is intact
@@ -1400,11 +1232,11 @@ End Sub
         line_count = code_module.CountOfLines
         full_code = code_module.Lines(1, line_count) if line_count > 0 else ""
 
-        print(f"Imported code: {len(full_code)} chars")
+        logger.debug("Imported code: %d chars", len(full_code))
 
         # Check that code exists
         assert len(full_code.strip()) > 0, "Code was lost during import"
 
         # The key success: import completed without errors despite having both
         # module-level and hidden member attributes in the source file
-        print("✅ SUCCESS: Module-level attributes preserved, hidden member attributes filtered!")
+        logger.info("✅ SUCCESS: Module-level attributes preserved, hidden member attributes filtered!")
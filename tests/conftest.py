@@ -47,11 +47,25 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-def pytest_sessionstart(session):
+# Fixtures and markers that mean a test drives a live Office application
+_OFFICE_FIXTURES = frozenset({"temp_office_doc", "vba_app"})
+_OFFICE_MARKERS = ("office", "com")
+
+
+def _needs_office(item):
+    """Return True if a collected test item will automate Office."""
+    if not _OFFICE_FIXTURES.isdisjoint(getattr(item, "fixturenames", ())):
+        return True
+    return any(item.get_closest_marker(name) for name in _OFFICE_MARKERS)
+
+
+def pytest_collection_finish(session):
     """Check Office application safety before starting integration tests.
 
-    This runs once at the very beginning of the test session, before any tests are collected.
-    Only runs if integration tests are being executed (not in CI pipeline).
+    This runs once after collection and before any test is executed. Collection
+    itself never automates Office, so the check still happens before any document
+    is touched. Only runs if integration tests are being executed (not in CI pipeline)
+    and at least one selected test actually needs Office.
     """
     # Check if we're running integration tests by looking at command line args
     config = session.config
@@ -60,6 +74,7 @@ def pytest_sessionstart(session):
     # 1. No test files specified (running all tests, likely in CI)
     # 2. Only running unit tests (no cli/ or integration markers)
     # 3. Running specific non-integration test files
+    # 4. None of the selected tests uses Office (e.g. -k/-m selections)
 
     # Get the test paths being run
     test_args = config.args if config.args else []
@@ -81,6 +96,9 @@ def pytest_sessionstart(session):
     if not has_integration_tests:
         return
 
+    if not any(_needs_office(item) for item in session.items):
+        return
+
     # Import the safety check function
     try:
         from tests.cli.helpers import check_office_apps_are_safe_to_use
@@ -172,6 +190,13 @@ def pytest_collection_modifyitems(config, items):
         # If test has app-specific markers and none match selected apps, skip it
         if test_apps and not any(app in selected_apps for app in test_apps):
             item.add_marker(pytest.mark.skip(reason=f"Test requires {test_apps} but only {selected_apps} selected"))
+            continue
+
+        # App-specific tests also run once per vba_app parameter; skip the other apps'
+        # variants here, before their fixtures (e.g. temp_office_doc) are set up
+        if test_apps and hasattr(item, "callspec") and "vba_app" in item.callspec.params:
+            if item.callspec.params["vba_app"] not in test_apps:
+                item.add_marker(pytest.mark.skip(reason=f"Test is specific to {test_apps}"))
 
 
 @pytest.fixture
@@ -306,25 +331,25 @@ def cleanup_office_apps():
                 if hasattr(app, "Workbooks"):  # Excel
                     count = app.Workbooks.Count
                     print(f"  - {count} Excel workbook(s) open, marking as saved...")
-                    for i in range(count, 0, -1):
+                    for workbook in app.Workbooks:
                         try:
-                            app.Workbooks(i).Saved = True
+                            workbook.Saved = True
                         except Exception:
                             pass
                 elif hasattr(app, "Documents"):  # Word
                     count = app.Documents.Count
                     print(f"  - {count} Word document(s) open, marking as saved...")
-                    for i in range(count, 0, -1):
+                    for document in app.Documents:
                         try:
-                            app.Documents(i).Saved = True
+                            document.Saved = True
                         except Exception:
                             pass
                 elif hasattr(app, "Presentations"):  # PowerPoint
                     count = app.Presentations.Count
                     print(f"  - {count} PowerPoint presentation(s) open, marking as saved...")
-                    for i in range(count, 0, -1):
+                    for presentation in app.Presentations:
                         try:
-                            app.Presentations(i).Saved = True
+                            presentation.Saved = True
                         except Exception:
                             pass
             except Exception:
@@ -283,6 +283,62 @@ def test_component_header_handling():
     assert "MultiUse = -1" in class_header
 
 
+def test_split_vba_content_is_memoized():
+    """Test that repeated splits of identical content are served from the cache."""
+    from vba_edit.office_vba import _split_vba_content
+
+    handler = VBAComponentHandler()
+    content = 'Attribute VB_Name = "CachedModule"\nSub Cached()\nEnd Sub'
+
+    first = handler.split_vba_content(content)
+    hits_before = _split_vba_content.cache_info().hits
+    second = handler.split_vba_content(content)
+
+    assert first == second == ('Attribute VB_Name = "CachedModule"', "Sub Cached()\nEnd Sub")
+    assert _split_vba_content.cache_info().hits == hits_before + 1
+
+
+def test_watch_skips_unchanged_file_content(mock_word_handler, temp_dir):
+    """Test that watch mode only re-imports files whose content actually changed."""
+    handler = mock_word_handler
+    module = temp_dir / "Watched.bas"
+    module.write_text('Attribute VB_Name = "Watched"\nSub A()\nEnd Sub\n')
+
+    # First event imports, an identical re-save is skipped
+    assert handler._should_import(module)
+    assert not handler._should_import(module)
+
+    # Changed content is imported again
+    module.write_text('Attribute VB_Name = "Watched"\nSub B()\nEnd Sub\n')
+    assert handler._should_import(module)
+    assert not handler._should_import(module)
+
+    # A deletion resets the entry, so re-creating identical content imports again
+    handler._forget_import(module)
+    assert handler._should_import(module)
+
+
+def test_split_vba_content_without_header_markers():
+    """Test that content without any header marker is returned unchanged as code."""
+    handler = VBAComponentHandler()
+    content = "Option Explicit\n\nSub NoHeader()\n    Debug.Print 1\nEnd Sub\n"
+
+    assert handler.split_vba_content(content) == ("", content)
+
+
+def test_split_vba_content_header_after_blank_lines():
+    """Test that headers preceded by blank lines or starting with BEGIN are still split."""
+    handler = VBAComponentHandler()
+
+    header, code = handler.split_vba_content('\n\nVERSION 1.0 CLASS\nBEGIN\n  MultiUse = -1\nEND\nSub A()\nEnd Sub')
+    assert header.startswith("VERSION 1.0 CLASS")
+    assert code == "Sub A()\nEnd Sub"
+
+    header, code = handler.split_vba_content("BEGIN\n  MultiUse = -1\nEND\nSub B()\nEnd Sub")
+    assert header == "BEGIN\n  MultiUse = -1\nEND"
+    assert code == "Sub B()\nEnd Sub"
+
+
 def test_word_handler_functionality(mock_word_handler, sample_vba_files):
     """Test Word VBA handler specific functionality."""
     handler = mock_word_handler
@@ -306,6 +362,37 @@ def test_word_handler_functionality(mock_word_handler, sample_vba_files):
     mock_code_module.AddFromString.assert_called_once_with("' Test Code")
 
 
+def test_word_close_document_quits_in_single_call(mock_word_handler):
+    """Test that closing the last Word document quits Word without a separate Close call."""
+    handler = mock_word_handler
+    mock_app = handler.app
+    mock_doc = handler.doc
+    mock_app.Documents.Count = 1
+
+    handler.close_document()
+
+    mock_app.Quit.assert_called_once_with(SaveChanges=0)
+    mock_doc.Close.assert_not_called()
+    assert handler.doc is None
+    assert handler.app is None
+
+
+def test_word_close_document_falls_back_when_quit_fails(mock_word_handler):
+    """Test that the document is still closed explicitly if quitting Word fails."""
+    handler = mock_word_handler
+    mock_app = handler.app
+    mock_doc = handler.doc
+    mock_app.Documents.Count = 1
+    mock_app.Quit.side_effect = Exception("Word is busy")
+
+    handler.close_document()
+
+    mock_doc.Close.assert_called_once_with(SaveChanges=False)
+    assert mock_app.Quit.call_count == 2
+    assert handler.doc is None
+    assert handler.app is mock_app
+
+
 def test_excel_handler_functionality(mock_excel_handler, sample_vba_files):
     """Test Excel VBA handler specific functionality."""
     handler = mock_excel_handler